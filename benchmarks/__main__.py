@@ -0,0 +1,112 @@
+"""
+Run the benchmark suite and write the results as JSON, optionally comparing with an earlier run
+
+    python -m benchmarks                       # everything, saved to .benchmarks/<commit>.json
+    python -m benchmarks -k profiles --json out.json
+    python -m benchmarks --compare .benchmarks/abc1234.json --fail-threshold 10
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .harness import Benchmark, Skip, discover
+
+RESULTS_DIR = ".benchmarks"
+
+
+def commit_info() -> Dict[str, object]:
+    """Describe the commit being benchmarked"""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                         stderr=subprocess.DEVNULL).decode().strip()
+        dirty = bool(subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"],
+                                             stderr=subprocess.DEVNULL).strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"id": "unknown", "dirty": False}
+    return {"id": commit, "dirty": dirty}
+
+
+def machine_info() -> Dict[str, str]:
+    """Describe the machine the benchmarks ran on"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "cpu_count": str(os.cpu_count())
+    }
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a readable unit"""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(results: List[Dict], baseline_path: str) -> Dict[str, float]:
+    """Get the relative change in median time of each benchmark against an earlier run"""
+    with open(baseline_path, "r") as f:
+        baseline = {b["name"]: b["stats"]["median"] for b in json.load(f)["benchmarks"]}
+    return {b["name"]: b["stats"]["median"] / baseline[b["name"]] - 1
+            for b in results if baseline.get(b["name"])}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the benchmark suite")
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--json", help=f"where to write results (default: {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to spend on each micro benchmark")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results to compare against")
+    parser.add_argument("--fail-threshold", type=float, metavar="PERCENT",
+                        help="exit with status 1 if any median gets slower than this")
+    args = parser.parse_args(argv)
+
+    results = []
+    skipped = []
+    for name, func, kwargs in discover(args.pattern):
+        benchmark = Benchmark(name, min_time=args.min_time)
+        try:
+            func(benchmark, **kwargs)
+        except Skip as e:
+            skipped.append({"name": name, "reason": str(e)})
+            print(f"{name:60} skipped: {e}")
+            continue
+        stats = benchmark.stats
+        results.append({"name": name, "stats": stats, "extra_info": benchmark.extra_info})
+        print(f"{name:60} median {format_time(stats['median']):>10}  "
+              f"min {format_time(stats['min']):>10}  rounds {stats['rounds']}")
+
+    info = commit_info()
+    output = {
+        "machine_info": machine_info(),
+        "commit_info": info,
+        "datetime": datetime.now().isoformat(),
+        "benchmarks": results,
+        "skipped": skipped
+    }
+    path = args.json or os.path.join(RESULTS_DIR, f"{info['id']}{'-dirty' if info['dirty'] else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(output, f, indent=2)
+    print(f"\nResults written to {path}")
+
+    if args.compare:
+        changes = compare(results, args.compare)
+        print(f"\nChange in median against {args.compare}:")
+        for name, change in changes.items():
+            print(f"{name:60} {change * 100:+7.1f}%")
+        if args.fail_threshold is not None and any(c * 100 > args.fail_threshold for c in changes.values()):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
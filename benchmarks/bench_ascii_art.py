@@ -0,0 +1,46 @@
+"""
+Logo loading through the manifest and bundle, and logo formatting with cold and warm caches
+"""
+from src.ascii_art import AsciiArt, colorize_logo, logo_record
+from src.logo_store import LogoStore
+
+
+def bench_load_logos(benchmark):
+    art = AsciiArt()
+    benchmark(art.load_logos)
+
+
+def bench_load_logos_without_bundle(benchmark):
+    store = LogoStore(use_bundle=False)
+    benchmark(store.load_index)
+
+
+def bench_get_all_logos(benchmark):
+    def get_all():
+        art = AsciiArt()
+        return [art.get_logo(distro) for distro in art.get_available_distros()]
+    benchmark(get_all)
+
+
+def bench_format_logo_cold(benchmark):
+    art = AsciiArt()
+    logos = [art.get_logo(distro) for distro in art.get_available_distros()]
+
+    def format_all():
+        logo_record.cache_clear()
+        colorize_logo.cache_clear()
+        for logo in logos:
+            art.format_logo(logo)
+            art.format_logo(logo, "cyan")
+    benchmark(format_all)
+
+
+def bench_format_logo_warm(benchmark):
+    art = AsciiArt()
+    logos = [art.get_logo(distro) for distro in art.get_available_distros()]
+
+    def format_all():
+        for logo in logos:
+            art.format_logo(logo)
+            art.format_logo(logo, "cyan")
+    benchmark(format_all)
@@ -0,0 +1,82 @@
+"""
+ProfileManager at 10, 1k and 50k profiles: loading from JSON files and SQLite, and searching
+"""
+import atexit
+import os
+import shutil
+import tempfile
+from typing import Dict
+
+from src.profile_storage import open_storage
+from src.profiles import ProfileManager
+
+from .harness import parametrize
+
+COUNTS = [10, 1000, 50000]
+
+GPUS = ["NVIDIA GeForce RTX 4090", "AMD Radeon RX 7900 XTX", "Intel Arc A770", "NVIDIA GeForce GTX 1080"]
+DISTROS = ["ubuntu", "arch", "fedora", "debian", "gentoo", "pop_os"]
+
+_fixtures: Dict[str, str] = {}
+
+
+def make_profile(i: int) -> Dict:
+    """Build a profile; every tenth one inherits from the one before it"""
+    if i % 10 == 9:
+        return {"name": f"profile{i:05d}", "parent": f"profile{i - 1:05d}",
+                "system_info": {"GPU": GPUS[(i + 1) % len(GPUS)]}}
+    return {
+        "name": f"profile{i:05d}",
+        "distro": DISTROS[i % len(DISTROS)],
+        "font_family": "Ubuntu Mono",
+        "font_size": 10,
+        "theme": {"background": "#300A24", "text": "#FFFFFF", "logo": f"#{i % 0xFFFFFF:06X}"},
+        "system_info": {"OS": f"{DISTROS[i % len(DISTROS)]} {i % 30}", "CPU": f"Ryzen {i % 10} {i}",
+                        "GPU": GPUS[i % len(GPUS)], "Memory": f"{i % 64}GiB / 64GiB"}
+    }
+
+
+def profiles_fixture(count: int, backend: str) -> str:
+    """Get a profile collection of the given size, generating it on first use"""
+    key = f"{backend}-{count}"
+    if key not in _fixtures:
+        root = tempfile.mkdtemp(prefix="fake-neofetch-bench-")
+        atexit.register(shutil.rmtree, root, True)
+        location = os.path.join(root, "profiles.db" if backend == "sqlite" else "profiles")
+        storage = open_storage(location)
+        storage.write_many({f"profile{i:05d}": make_profile(i) for i in range(count)})
+        storage.close()
+        _fixtures[key] = location
+    return _fixtures[key]
+
+
+@parametrize("count", COUNTS)
+def bench_load_profiles_json(benchmark, count):
+    location = profiles_fixture(count, "json")
+    # Opening a JSON directory reads every profile
+    benchmark.pedantic(ProfileManager, setup=lambda: ((location,), {}), rounds=3)
+
+
+@parametrize("count", COUNTS)
+def bench_load_profiles_sqlite(benchmark, count):
+    location = profiles_fixture(count, "sqlite")
+
+    def load():
+        manager = ProfileManager(location)
+        manager.load_profiles()
+        manager.storage.close()
+    benchmark.pedantic(load, rounds=3)
+
+
+@parametrize("count", COUNTS)
+def bench_resolve_all_profiles(benchmark, count):
+    manager = ProfileManager(profiles_fixture(count, "json"))
+    names = manager.get_profiles()
+    benchmark.pedantic(lambda: [manager.load_profile(name) for name in names], rounds=3)
+
+
+@parametrize("count", COUNTS)
+def bench_search_profiles(benchmark, count):
+    manager = ProfileManager(profiles_fixture(count, "json"))
+    manager.search_profiles("")
+    benchmark.extra_info["matches"] = len(benchmark(manager.search_profiles, "distro:arch rtx"))
@@ -0,0 +1,41 @@
+"""
+SystemInfo probing: each probe on its own, and a full refresh with and without the probe cache
+"""
+import importlib.util
+import os
+import tempfile
+
+from src.hardware_info import SystemInfo
+from src.probe_cache import ProbeCache
+
+from .harness import Skip, parametrize
+
+PROBE_FIELDS = list(SystemInfo.PROBES)
+
+
+def _require_system_info():
+    # hardware_info imports psutil lazily, so without it the probes would only time their fallbacks
+    if importlib.util.find_spec("psutil") is None:
+        raise Skip("psutil is not installed")
+
+
+@parametrize("field", PROBE_FIELDS)
+def bench_probe(benchmark, field):
+    _require_system_info()
+    info = SystemInfo(use_cache=False)
+    benchmark.extra_info["value"] = benchmark(getattr(info, SystemInfo.PROBES[field]))
+
+
+def bench_refresh_uncached(benchmark):
+    _require_system_info()
+    info = SystemInfo(use_cache=False)
+    benchmark(info.refresh)
+    benchmark.extra_info["timed_out"] = info.get_timed_out_probes()
+
+
+def bench_refresh_cached(benchmark):
+    _require_system_info()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        info = SystemInfo(cache=ProbeCache(os.path.join(cache_dir, "probes.json"), ttls=SystemInfo.CACHE_TTLS))
+        info.refresh()
+        benchmark(info.refresh)
@@ -0,0 +1,78 @@
+"""
+TerminalWidget rendering under the offscreen Qt platform, including a keystroke-by-keystroke edit loop
+"""
+import os
+
+from src.ascii_art import AsciiArt
+
+from .harness import Skip
+
+INFO = {
+    "OS": "Ubuntu 24.04 LTS x86_64", "Host": "ThinkPad X1 Carbon", "Kernel": "6.8.0-31-generic",
+    "Uptime": "3 hours, 12 mins", "Packages": "2417 (dpkg), 12 (snap)", "Shell": "bash 5.2.21",
+    "Resolution": "2560x1440", "DE": "GNOME 46", "WM": "Mutter", "Theme": "Yaru-dark",
+    "Terminal": "gnome-terminal", "CPU": "Intel i7-1365U (12) @ 5.2GHz", "GPU": "Intel Iris Xe",
+    "Memory": "6123MiB / 31822MiB"
+}
+
+TYPED_TEXT = "NVIDIA GeForce RTX 4090"
+
+_app = None
+
+
+def make_terminal():
+    """Create a TerminalWidget on an offscreen QApplication"""
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        raise Skip("PyQt6 is not installed")
+    from src.gui.terminal_widget import TerminalWidget
+
+    _app = QApplication.instance() or QApplication([])
+    return TerminalWidget(interactive=False), _app
+
+
+def bench_update_content_full(benchmark):
+    terminal, _ = make_terminal()
+    art = AsciiArt()
+    logos = [art.get_logo("ubuntu"), art.get_logo("arch")]
+    rounds = [0]
+
+    # Alternate logos so every call rebuilds the whole document
+    def render():
+        rounds[0] += 1
+        terminal.update_content(logos[rounds[0] % 2], INFO)
+    benchmark(render)
+
+
+def bench_keystroke(benchmark):
+    terminal, _ = make_terminal()
+    logo = AsciiArt().get_logo("ubuntu")
+    info = dict(INFO)
+    terminal.update_content(logo, info)
+    typed = [0]
+
+    # One round is one more character typed into the GPU field
+    def keystroke():
+        typed[0] = typed[0] % len(TYPED_TEXT) + 1
+        info["GPU"] = TYPED_TEXT[:typed[0]]
+        terminal.update_content(logo, info)
+    benchmark(keystroke)
+
+
+def bench_keystroke_loop(benchmark):
+    terminal, app = make_terminal()
+    logo = AsciiArt().get_logo("ubuntu")
+    terminal.update_content(logo, INFO)
+
+    # Type a whole value, letting Qt process events (and repaint) after each keystroke
+    def type_value():
+        info = dict(INFO)
+        for i in range(1, len(TYPED_TEXT) + 1):
+            info["GPU"] = TYPED_TEXT[:i]
+            terminal.update_content(logo, info)
+            app.processEvents()
+    benchmark.pedantic(type_value, rounds=10)
+    benchmark.extra_info["keystrokes"] = len(TYPED_TEXT)
@@ -0,0 +1,96 @@
+"""
+Minimal pytest-benchmark style harness: bench_* functions take a `benchmark` fixture and call it with the code to time
+"""
+import gc
+import importlib
+import os
+import statistics
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Skip(Exception):
+    """Raised by a benchmark that cannot run here, e.g. when PyQt6 is missing"""
+
+
+def parametrize(name: str, values: List):
+    """Run a benchmark once per value, passing it as a keyword argument"""
+    def decorator(func: Callable) -> Callable:
+        func.params = (name, list(values))
+        return func
+    return decorator
+
+
+class Benchmark:
+    """Time a callable over several rounds and keep summary statistics"""
+
+    def __init__(self, name: str, min_time: float = 0.2, max_rounds: int = 1000, min_rounds: int = 5):
+        self.name = name
+        self.min_time = min_time
+        self.max_rounds = max_rounds
+        self.min_rounds = min_rounds
+        self.stats: Optional[Dict[str, float]] = None
+        self.extra_info: Dict[str, object] = {}
+
+    def __call__(self, func: Callable, *args, **kwargs):
+        """Run func repeatedly until min_time has passed, returning its last result"""
+        result = func(*args, **kwargs)  # warm-up
+        times = []
+        started = time.perf_counter()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            while len(times) < self.max_rounds and (len(times) < self.min_rounds
+                                                     or time.perf_counter() - started < self.min_time):
+                t0 = time.perf_counter()
+                result = func(*args, **kwargs)
+                times.append(time.perf_counter() - t0)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self._record(times)
+        return result
+
+    def pedantic(self, func: Callable, setup: Optional[Callable[[], Tuple[tuple, dict]]] = None,
+                 rounds: int = 3):
+        """Run func a fixed number of rounds, calling setup before each one outside the timing"""
+        times = []
+        result = None
+        for _ in range(rounds):
+            args, kwargs = setup() if setup else ((), {})
+            t0 = time.perf_counter()
+            result = func(*args, **kwargs)
+            times.append(time.perf_counter() - t0)
+        self._record(times)
+        return result
+
+    def _record(self, times: List[float]) -> None:
+        self.stats = {
+            "min": min(times),
+            "max": max(times),
+            "mean": statistics.mean(times),
+            "median": statistics.median(times),
+            "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "rounds": len(times),
+            "ops": 1 / statistics.mean(times) if statistics.mean(times) else 0.0
+        }
+
+
+def discover(pattern: str = "") -> Iterator[Tuple[str, Callable, dict]]:
+    """Yield (full name, function, kwargs) for every bench_* case whose name contains pattern"""
+    for filename in sorted(os.listdir(BENCH_DIR)):
+        if not (filename.startswith("bench_") and filename.endswith(".py")):
+            continue
+        module = importlib.import_module(f"benchmarks.{filename[:-3]}")
+        for attr in sorted(vars(module)):
+            func = getattr(module, attr)
+            if not (attr.startswith("bench_") and callable(func)):
+                continue
+            params = getattr(func, "params", None)
+            cases = [({}, "")] if params is None else [({params[0]: v}, f"[{v}]") for v in params[1]]
+            for kwargs, suffix in cases:
+                name = f"{filename[:-3]}::{attr}{suffix}"
+                if pattern in name:
+                    yield name, func, kwargs
@@ -0,0 +1,14 @@
+"""
+Fake Neofetch - headless terminal output without the GUI
+"""
+import os
+import sys
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from src.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,6 +36,10 @@ python -m pip install --upgrade pip
 echo Installing requirements...
 pip install -r requirements.txt
 
+:: Pack the distro logos into a single bundle for faster startup
+echo Building logo bundle...
+python -m src.logo_bundle
+
 echo.
 echo Installation complete!
 echo To run the application, activate the virtual environment and run:
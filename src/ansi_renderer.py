@@ -0,0 +1,85 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .ascii_art import logo_palette
+from .layout import SideBySideLayout
+
+RESET = "\033[0m"
+
+# Same colors the Qt terminal preview starts with
+DEFAULT_THEME = {
+    "background": "#300A24",
+    "text": "#FFFFFF",
+    "user": "#E95420",
+    "separator": "#E95420",
+    "label": "#E95420",
+    "info": "#FFFFFF",
+    "logo": "#E95420"
+}
+
+
+def hex_to_ansi(color: str) -> str:
+    """Convert a #RRGGBB color into a 24-bit ANSI foreground escape"""
+    color = color.lstrip("#")
+    if len(color) != 6:
+        return ""
+    try:
+        r, g, b = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    except ValueError:
+        return ""
+    return f"\033[38;2;{r};{g};{b}m"
+
+
+@lru_cache(maxsize=64)
+def _compile_ansi(items: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    theme = dict(items)
+    escapes = {key: hex_to_ansi(color) for key, color in items}
+    for i, color in enumerate(logo_palette(theme), 1):
+        escapes[f"c{i}"] = hex_to_ansi(color)
+    return escapes
+
+
+def compile_ansi(theme: Dict[str, str]) -> Dict[str, str]:
+    """Get the escapes a theme needs, one per color key plus c1..c6 for the logo, memoized per theme"""
+    return _compile_ansi(tuple(sorted(theme.items())))
+
+
+class AnsiRenderer:
+    """Render a logo and system info as ANSI-colored terminal text"""
+
+    def __init__(self, theme: Optional[Dict[str, str]] = None, use_color: bool = True):
+        self.theme = dict(DEFAULT_THEME)
+        self.theme.update(theme or {})
+        self.use_color = use_color
+        self.layout = SideBySideLayout()
+        self.escapes = compile_ansi(self.theme)
+
+    def render(self, logo: str, info: Dict[str, str]) -> str:
+        """Render the logo with aligned info lines beside it"""
+        self.layout.set_logo(logo)
+        self.layout.set_info(info)
+        palette = [self.escapes[f"c{i}"] for i in range(1, 7)]
+        label = self.escapes.get("label", "")
+        value = self.escapes.get("info", "")
+
+        lines: List[str] = []
+        for row in self.layout.rows():
+            if not self.use_color:
+                lines.append(row.logo + row.label + row.value)
+                continue
+            segments = [(palette[color - 1], text) for color, text in row.spans]
+            segments += [(label, row.label), (value, row.value)]
+            parts = []
+            current = ""
+            # Only emit an escape when the color actually changes
+            for escape, text in segments:
+                if not text:
+                    continue
+                if escape != current and (escape or current):
+                    parts.append(escape or RESET)
+                    current = escape
+                parts.append(text)
+            if current:
+                parts.append(RESET)
+            lines.append("".join(parts))
+        return "\n".join(lines)
@@ -1,79 +1,143 @@
-import os
-from typing import List, Optional
-import yaml
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .logo_store import LogoStore
+from .utils.text import COLOR_MARKER, display_width
+
+# Basic ANSI color codes
+ANSI_COLORS = {
+    "red": "\033[31m",
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+    "blue": "\033[34m",
+    "magenta": "\033[35m",
+    "cyan": "\033[36m",
+    "white": "\033[37m",
+    "reset": "\033[0m"
+}
+
+
+# A run of logo text drawn in one palette color (1-6)
+Span = Tuple[int, str]
+
+
+def parse_color_spans(logo: str) -> Tuple[str, Tuple[Tuple[Span, ...], ...]]:
+    """Split a logo with ${cN} markers into plain text and run-length encoded color spans per line"""
+    color = 1
+    lines = []
+    plain_lines = []
+    for line in logo.split("\n"):
+        spans: List[Span] = []
+        pos = 0
+        for match in COLOR_MARKER.finditer(line):
+            if match.start() > pos:
+                spans.append((color, line[pos:match.start()]))
+            color = int(match.group(1))
+            pos = match.end()
+        if pos < len(line):
+            spans.append((color, line[pos:]))
+        # Merge neighbouring runs that ended up in the same color
+        merged: List[Span] = []
+        for span in spans:
+            if merged and merged[-1][0] == span[0]:
+                merged[-1] = (span[0], merged[-1][1] + span[1])
+            else:
+                merged.append(span)
+        lines.append(tuple(merged))
+        plain_lines.append("".join(text for _, text in merged))
+    return "\n".join(plain_lines), tuple(lines)
+
+
+class LogoRecord:
+    """Plain text, line offsets, color spans, display width and height of a logo, computed once"""
+    __slots__ = ("source", "text", "spans", "line_offsets", "width", "height")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.text, self.spans = parse_color_spans(source)
+        text = self.text
+        self.line_offsets = array("I", [0])
+        width = 0
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            line_end = len(text) if end < 0 else end
+            width = max(width, display_width(text[start:line_end]))
+            if end < 0:
+                break
+            start = end + 1
+            self.line_offsets.append(start)
+        self.width = width
+        self.height = len(self.line_offsets)
+
+    def line(self, index: int) -> str:
+        """Get a single plain line of the logo without its newline"""
+        start = self.line_offsets[index]
+        end = self.line_offsets[index + 1] - 1 if index + 1 < self.height else len(self.text)
+        return self.text[start:end]
+
+    def lines(self) -> List[str]:
+        """Get every plain line of the logo"""
+        return [self.line(i) for i in range(self.height)]
+
+
+@lru_cache(maxsize=256)
+def logo_record(logo: str) -> LogoRecord:
+    """Get the metrics record for a logo, cached per logo text"""
+    return LogoRecord(logo)
+
+
+@lru_cache(maxsize=128)
+def colorize_logo(logo: str, color: str) -> str:
+    """Wrap each non-empty line of a logo in an ANSI color, cached per (logo, color)"""
+    code = ANSI_COLORS[color]
+    reset = ANSI_COLORS["reset"]
+    return "\n".join(f"{code}{line}{reset}" if line.strip() else line
+                     for line in logo_record(logo).lines())
+
+
+def logo_palette(theme: Dict[str, str]) -> Tuple[str, ...]:
+    """Get the colors for ${c1}..${c6}: "logo" for c1, then "logo2".."logo6" falling back to "logo" """
+    base = theme.get("logo", "")
+    return (base,) + tuple(theme.get(f"logo{n}", base) for n in range(2, 7))
+
 
 class AsciiArt:
-    def __init__(self):
-        self.logo_dir = os.path.join("resources", "ascii", "distro_logos")
-        self.logos = {}
-        self.load_logos()
+    def __init__(self, logo_dir: Optional[str] = None):
+        self.store = LogoStore(logo_dir)
+        self.logo_dir = self.store.logo_dir
 
     def load_logos(self):
-        """Load all available distro logos"""
-        for file_name in os.listdir(self.logo_dir):
-            if file_name.endswith(".txt"):
-                distro_name = os.path.splitext(file_name)[0]
-                with open(os.path.join(self.logo_dir, file_name), "r") as f:
-                    self.logos[distro_name] = f.read()
+        """Load the index of available distro logos; bodies are read on first use"""
+        self.store.load_index()
 
     def get_logo(self, distro: str) -> str:
         """Get ASCII art logo for a specific distro"""
-        return self.logos.get(distro.lower(), "")
+        return self.store.get(distro) or ""
 
     def add_logo(self, distro_name: str, logo: str) -> None:
         """Add a new logo to the collection"""
-        self.logos[distro_name.lower()] = logo
-        self._save_logo(distro_name, logo)
-
-    def _save_logo(self, distro_name: str, logo: str) -> None:
-        """Save a logo to the resources directory"""
-        logos_dir = os.path.join(os.path.dirname(__file__), "..", "resources", "ascii", "distro_logos")
-        if not os.path.exists(logos_dir):
-            os.makedirs(logos_dir)
-
-        filename = os.path.join(logos_dir, f"{distro_name.lower()}.txt")
-        with open(filename, "w") as f:
-            f.write(logo)
+        self.store.add(distro_name, logo)
 
     def get_available_distros(self) -> List[str]:
         """Get list of available distro logos"""
-        return list(self.logos.keys())
+        return self.store.names()
+
+    def get_logo_record(self, logo: str) -> "LogoRecord":
+        """Get the precomputed metrics for a logo"""
+        return logo_record(logo)
 
     def format_logo(self, logo: str, color: str = "default") -> str:
         """Format the logo with ANSI color codes"""
-        if color == "default":
-            return logo
-
-        # Basic ANSI color codes
-        colors = {
-            "red": "\033[31m",
-            "green": "\033[32m",
-            "yellow": "\033[33m",
-            "blue": "\033[34m",
-            "magenta": "\033[35m",
-            "cyan": "\033[36m",
-            "white": "\033[37m",
-            "reset": "\033[0m"
-        }
-
-        if color not in colors:
-            return logo
-
-        # Apply color to non-empty lines
-        lines = logo.split("\n")
-        colored_lines = []
-        for line in lines:
-            if line.strip():
-                colored_lines.append(f"{colors[color]}{line}{colors['reset']}")
-            else:
-                colored_lines.append(line)
-
-        return "\n".join(colored_lines)
+        if color == "default" or color not in ANSI_COLORS:
+            return logo_record(logo).text
+        return colorize_logo(logo, color)
 
     def get_logo_height(self, logo: str) -> int:
         """Get the height of a logo in lines"""
-        return len(logo.split("\n"))
+        return logo_record(logo).height
 
     def get_logo_width(self, logo: str) -> int:
-        """Get the width of a logo in characters"""
-        return max(len(line) for line in logo.split("\n")) 
\ No newline at end of file
+        """Get the width of a logo in terminal cells"""
+        return logo_record(logo).width
@@ -0,0 +1,163 @@
+"""
+Headless neofetch-style output for shells and MOTD scripts; never imports PyQt6
+"""
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+from .ansi_renderer import AnsiRenderer
+from .ascii_art import AsciiArt
+from .package_info import read_distro_ids
+from . import tracing
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(prog="fake-neofetch",
+                                     description="Print neofetch-style system info to the terminal")
+    parser.add_argument("--distro", help="logo to show (defaults to the running distro)")
+    parser.add_argument("--profile", help="render a saved profile instead of probing the system")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="fake a single field, can be given multiple times")
+    parser.add_argument("--theme", help="color theme to use, from resources/themes or ~/.config/fake-neofetch/themes")
+    parser.add_argument("--list-themes", action="store_true", help="list available themes and exit")
+    parser.add_argument("--color", choices=("auto", "always", "never"), default="auto",
+                        help="when to emit ANSI colors (default: auto)")
+    parser.add_argument("--profiles-dir", help="profile directory or .db/.sqlite database to use (default: resources/profiles)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="record timing spans and write them as a Chrome trace / Perfetto JSON file")
+    parser.add_argument("--trace-summary", action="store_true",
+                        help="print a table of where the time went to stderr")
+    parser.add_argument("--export-profiles", metavar="ARCHIVE",
+                        help="write every profile to a JSON Lines archive (.jsonl or .jsonl.gz) and exit")
+    parser.add_argument("--import-profiles", metavar="ARCHIVE",
+                        help="import profiles from a JSON Lines archive and exit")
+    return parser.parse_args(argv)
+
+
+def detect_distro(ascii_art: AsciiArt) -> str:
+    """Pick the logo for the running distro, falling back to Ubuntu"""
+    available = ascii_art.get_available_distros()
+    for distro_id in read_distro_ids():
+        if distro_id in available:
+            return distro_id
+    return "ubuntu"
+
+
+def parse_overrides(pairs: List[str]) -> Dict[str, str]:
+    """Turn KEY=VALUE arguments into a dict"""
+    overrides = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got: {pair}")
+        overrides[key] = value
+    return overrides
+
+
+def report_progress(verb: str):
+    """Build a progress callback that rewrites a single status line on stderr"""
+    def progress(count: int) -> None:
+        print(f"\r{verb} {count} profiles", end="", file=sys.stderr, flush=True)
+    return progress
+
+
+def transfer_profiles(args: argparse.Namespace) -> int:
+    """Run a bulk profile import or export"""
+    from .profiles import ProfileManager
+
+    manager = ProfileManager(args.profiles_dir)
+    if args.export_profiles:
+        manager.export_profiles(args.export_profiles, report_progress("Exported"))
+        print(file=sys.stderr)
+        return 0
+
+    result = manager.import_profiles(args.import_profiles, report_progress("Imported"))
+    manager.flush()
+    print(file=sys.stderr)
+    for line_number, error in result.errors:
+        print(f"line {line_number}: {error}", file=sys.stderr)
+    if result.rejected:
+        print(f"Rejected {result.rejected} invalid records", file=sys.stderr)
+    return 1 if result.rejected else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not (args.trace or args.trace_summary):
+        return run(args)
+
+    tracing.enable()
+    try:
+        with tracing.span("cli.main", "app"):
+            return run(args)
+    finally:
+        if args.trace:
+            try:
+                tracing.tracer.dump(args.trace)
+            except OSError as e:
+                print(f"fake-neofetch: could not write trace: {e}", file=sys.stderr)
+        if args.trace_summary:
+            print(tracing.tracer.format_summary(), file=sys.stderr)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Do what the parsed arguments ask for"""
+    if args.export_profiles or args.import_profiles:
+        try:
+            return transfer_profiles(args)
+        except OSError as e:
+            print(f"fake-neofetch: {e}", file=sys.stderr)
+            return 1
+
+    if args.list_themes:
+        from .themes import ThemeRegistry
+
+        print("\n".join(ThemeRegistry().names()))
+        return 0
+
+    try:
+        overrides = parse_overrides(args.overrides)
+    except ValueError as e:
+        print(f"fake-neofetch: {e}", file=sys.stderr)
+        return 2
+
+    ascii_art = AsciiArt()
+    theme = {}
+
+    if args.profile:
+        from .profiles import ProfileManager
+
+        profile = ProfileManager(args.profiles_dir).load_profile(args.profile)
+        if not profile:
+            print(f"fake-neofetch: profile not found: {args.profile}", file=sys.stderr)
+            return 1
+        distro = args.distro or profile.get("distro", "")
+        theme = profile.get("theme", {})
+        info = dict(profile.get("system_info", {}))
+        info.update(overrides)
+    else:
+        from .hardware_info import SystemInfo
+
+        distro = args.distro or detect_distro(ascii_art)
+        info = SystemInfo(overrides=overrides).get_all()
+
+    if args.theme:
+        from .themes import ThemeRegistry
+
+        named_theme = ThemeRegistry().get(args.theme)
+        if named_theme is None:
+            print(f"fake-neofetch: theme not found: {args.theme}", file=sys.stderr)
+            return 1
+        theme = dict(theme, **named_theme.colors)
+
+    use_color = args.color == "always" or (args.color == "auto" and sys.stdout.isatty())
+    renderer = AnsiRenderer(theme, use_color=use_color)
+    with tracing.span("cli.render", "render"):
+        output = renderer.render(ascii_art.get_logo(distro), info)
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,17 +3,23 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QCheckBox, QFileDialog, QMessageBox, QInputDialog,
                              QColorDialog, QFontComboBox, QFrame, QLineEdit,
                              QGroupBox, QScrollArea, QGridLayout)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 import os
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Set
 
+from .render_scheduler import RenderScheduler
 from .terminal_widget import TerminalWidget
-from ..hardware_info import SystemInfo
+from .theme_cache import color_button_style
 from ..ascii_art import AsciiArt
-from ..profiles import ProfileManager
+from ..themes import OPTIONAL_COLORS, ThemeRegistry
+from .. import tracing
 
 class SystemInfo:
+    # Fields that change while the app runs and are re-sampled in live mode
+    VOLATILE_FIELDS = ("uptime", "memory", "cpu_usage", "memory_usage", "disk_usage")
+
     def __init__(self):
         self.os = "Ubuntu 22.04 LTS"
         self.host = "ubuntu-desktop"
@@ -39,6 +45,30 @@ class SystemInfo:
     def to_dict(self) -> Dict[str, str]:
         return {k: v for k, v in self.__dict__.items()}
 
+    def sample_volatile(self) -> Dict[str, str]:
+        """Re-sample the volatile fields from the running system and return the ones that changed"""
+        import psutil
+
+        uptime = int(time.time() - psutil.boot_time())
+        mem = psutil.virtual_memory()
+        disk = psutil.disk_usage(os.path.abspath(os.sep))
+        gib = 1024 ** 3
+        samples = {
+            "uptime": f"{uptime // 3600} hours, {uptime % 3600 // 60} minutes",
+            "memory": f"{mem.used // (1024 * 1024)}MiB / {mem.total // (1024 * 1024)}MiB",
+            "cpu_usage": f"{psutil.cpu_percent(interval=None):.0f}%",
+            "memory_usage": f"{mem.used / gib:.1f}GB / {mem.total / gib:.0f}GB",
+            "disk_usage": f"{disk.used / gib:.0f}GB / {disk.total / gib:.0f}GB"
+        }
+
+        changed = {}
+        for key in self.VOLATILE_FIELDS:
+            value = samples[key]
+            if getattr(self, key) != value:
+                setattr(self, key, value)
+                changed[key] = value
+        return changed
+
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> 'SystemInfo':
         info = cls()
@@ -48,98 +78,20 @@ class SystemInfo:
         return info
 
 class MainWindow(QMainWindow):
-    DISTRO_THEMES = {
-        "Ubuntu": {
-            "background": "#300A24",
-            "text": "#FFFFFF",
-            "user": "#E95420",
-            "separator": "#E95420",
-            "label": "#E95420",
-            "info": "#FFFFFF",
-            "logo": "#E95420"
-        },
-        "Arch": {
-            "background": "#1793D1",
-            "text": "#FFFFFF",
-            "user": "#1793D1",
-            "separator": "#1793D1",
-            "label": "#1793D1",
-            "info": "#FFFFFF",
-            "logo": "#1793D1"
-        },
-        "Debian": {
-            "background": "#A80030",
-            "text": "#FFFFFF",
-            "user": "#A80030",
-            "separator": "#A80030",
-            "label": "#A80030",
-            "info": "#FFFFFF",
-            "logo": "#A80030"
-        },
-        "Fedora": {
-            "background": "#0F1C8C",
-            "text": "#FFFFFF",
-            "user": "#0F1C8C",
-            "separator": "#0F1C8C",
-            "label": "#0F1C8C",
-            "info": "#FFFFFF",
-            "logo": "#0F1C8C"
-        },
-        "Manjaro": {
-            "background": "#35BF5C",
-            "text": "#FFFFFF",
-            "user": "#35BF5C",
-            "separator": "#35BF5C",
-            "label": "#35BF5C",
-            "info": "#FFFFFF",
-            "logo": "#35BF5C"
-        },
-        "Void": {
-            "background": "#8A4D76",
-            "text": "#FFFFFF",
-            "user": "#8A4D76",
-            "separator": "#8A4D76",
-            "label": "#8A4D76",
-            "info": "#FFFFFF",
-            "logo": "#8A4D76"
-        },
-        "Gentoo": {
-            "background": "#54487A",
-            "text": "#FFFFFF",
-            "user": "#54487A",
-            "separator": "#54487A",
-            "label": "#54487A",
-            "info": "#FFFFFF",
-            "logo": "#54487A"
-        },
-        "Kali": {
-            "background": "#000000",
-            "text": "#FFFFFF",
-            "user": "#557C94",
-            "separator": "#557C94",
-            "label": "#557C94",
-            "info": "#FFFFFF",
-            "logo": "#557C94"
-        },
-        "Elementary": {
-            "background": "#2D2D2D",
-            "text": "#FFFFFF",
-            "user": "#7B1E3D",
-            "separator": "#7B1E3D",
-            "label": "#7B1E3D",
-            "info": "#FFFFFF",
-            "logo": "#7B1E3D"
-        },
-        "Pop!_OS": {
-            "background": "#000000",
-            "text": "#FFFFFF",
-            "user": "#48B9C7",
-            "separator": "#48B9C7",
-            "label": "#48B9C7",
-            "info": "#FFFFFF",
-            "logo": "#48B9C7"
-        }
-    }
+    # How often live mode re-samples volatile fields
+    LIVE_INTERVAL_MS = 1000
+
+    # How long to collect change events before rendering them in one go
+    RENDER_INTERVAL_MS = 16
+
+    # How long after showing the window to build the controls if the preview hasn't painted yet
+    BUILD_CONTROLS_FALLBACK_MS = 500
+
+    # Emitted once the terminal preview has been painted for the first time
+    firstFrameShown = pyqtSignal()
+
+    # Most profiles to list in the profile combo at once; narrow the filter to find others
+    PROFILE_LIST_LIMIT = 500
 
     def __init__(self):
         super().__init__()
@@ -150,7 +102,13 @@ class MainWindow(QMainWindow):
             # Initialize components
             self.system_info = SystemInfo()
             self.ascii_art = AsciiArt()
-            self.profile_manager = ProfileManager()
+            self.render_scheduler = RenderScheduler(self.render_pending, self.RENDER_INTERVAL_MS, parent=self)
+            # Theme colors waiting for the next render, see set_theme
+            self._pending_theme: Optional[Dict[str, str]] = None
+            self.color_buttons = {}
+            self._button_colors = {}
+            self.controls_built = False
+            self._first_frame_shown = False
             
             # Create central widget and main layout
             central_widget = QWidget()
@@ -183,11 +141,12 @@ class MainWindow(QMainWindow):
             # Create container for controls
             controls_container = QWidget()
             controls_container.setObjectName("controls_container")
-            controls_layout = QVBoxLayout(controls_container)
+            self.controls_layout = controls_layout = QVBoxLayout(controls_container)
             controls_layout.setContentsMargins(0, 0, 0, 0)
             controls_layout.setSpacing(15)
             
-            # Add control groups
+            # Add control groups; only the distro picker is needed for the first frame,
+            # the rest are built by build_controls once the preview is on screen
             # Distribution selection
             distro_group = QGroupBox("Distribution")
             distro_layout = QVBoxLayout(distro_group)
@@ -196,83 +155,6 @@ class MainWindow(QMainWindow):
             distro_layout.addWidget(self.distro_combo)
             controls_layout.addWidget(distro_group)
             
-            # Font settings
-            font_group = QGroupBox("Font Settings")
-            font_layout = QVBoxLayout(font_group)
-            
-            # Font family
-            font_layout.addWidget(QLabel("Font Family:"))
-            self.font_combo = QFontComboBox()
-            self.font_combo.setCurrentFont(QFont("Ubuntu Mono"))
-            font_layout.addWidget(self.font_combo)
-            
-            # Font size
-            font_layout.addWidget(QLabel("Font Size:"))
-            self.font_size = QSpinBox()
-            self.font_size.setRange(8, 24)
-            self.font_size.setValue(10)
-            font_layout.addWidget(self.font_size)
-            
-            controls_layout.addWidget(font_group)
-            
-            # Theme Colors
-            colors_group = QGroupBox("Theme Colors")
-            colors_layout = QGridLayout(colors_group)
-            colors_layout.setSpacing(5)
-            
-            self.color_buttons = {}
-            color_elements = [
-                ("Background", "background"),
-                ("Text", "text"),
-                ("Logo", "logo"),
-                ("Labels", "label"),
-                ("Info", "info"),
-                ("User", "user"),
-                ("Separator", "separator")
-            ]
-            
-            for i, (label_text, color_key) in enumerate(color_elements):
-                label = QLabel(label_text + ":")
-                btn = QPushButton()
-                btn.setFixedSize(30, 20)
-                btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                btn.clicked.connect(lambda checked, k=color_key: self.choose_color(k))
-                
-                # Store button for later access
-                self.color_buttons[color_key] = btn
-                
-                colors_layout.addWidget(label, i, 0)
-                colors_layout.addWidget(btn, i, 1)
-            
-            controls_layout.addWidget(colors_group)
-            
-            # System Information
-            info_group = QGroupBox("System Information")
-            info_layout = QVBoxLayout(info_group)
-            
-            # Create input fields for each system info item
-            self.info_inputs = {}
-            for key, value in self.system_info.to_dict().items():
-                label = QLabel(key.capitalize() + ":")
-                input_field = QLineEdit(value)
-                input_field.textChanged.connect(lambda text, k=key: self.update_info(k, text))
-                self.info_inputs[key] = input_field
-                info_layout.addWidget(label)
-                info_layout.addWidget(input_field)
-            
-            controls_layout.addWidget(info_group)
-            
-            # Export controls
-            export_group = QGroupBox("Export")
-            export_layout = QVBoxLayout(export_group)
-            
-            self.copy_btn = QPushButton("Copy to Clipboard")
-            self.screenshot_btn = QPushButton("Take Screenshot")
-            export_layout.addWidget(self.copy_btn)
-            export_layout.addWidget(self.screenshot_btn)
-            
-            controls_layout.addWidget(export_group)
-            
             # Add stretch at the bottom
             controls_layout.addStretch()
             
@@ -288,13 +170,20 @@ class MainWindow(QMainWindow):
             # Create terminal widget
             self.terminal = TerminalWidget(is_preview=True)
             right_layout.addWidget(self.terminal)
+            self.terminal.terminal.viewport().installEventFilter(self)
             
             # Add panels to main layout
             main_layout.addWidget(left_panel)
             main_layout.addWidget(right_panel, 1)
             
-            # Setup connections
-            self.setup_connections()
+            # Debug panel for span timings, only when tracing is on (FAKE_NEOFETCH_TRACE=1)
+            if tracing.is_enabled():
+                from .trace_panel import TracePanel
+                
+                self.trace_panel = TracePanel(self)
+                self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.trace_panel)
+            
+            self.distro_combo.currentTextChanged.connect(lambda: self.schedule_render("content"))
             
             # Initial display
             self.update_display()
@@ -420,6 +309,158 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to initialize main window: {str(e)}")
             raise
 
+    def eventFilter(self, obj, event):
+        """Notice the first paint of the terminal preview"""
+        if (not self._first_frame_shown and event.type() == QEvent.Type.Paint
+                and obj is self.terminal.terminal.viewport()):
+            self._first_frame_shown = True
+            obj.removeEventFilter(self)
+            self.firstFrameShown.emit()
+            QTimer.singleShot(0, self.build_controls)
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        """Make sure the controls get built even if the preview is never painted"""
+        super().showEvent(event)
+        if not self.controls_built:
+            QTimer.singleShot(self.BUILD_CONTROLS_FALLBACK_MS, self.build_controls)
+
+    def build_controls(self):
+        """Build the secondary control panels, after the terminal preview has been painted"""
+        if self.controls_built:
+            return
+        self.controls_built = True
+        try:
+            with tracing.span("window.build_controls", "startup"):
+                self._create_controls()
+                self.setup_connections()
+                self.update_theme(self.terminal.theme_colors)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to build controls: {str(e)}")
+            raise
+
+    def _create_controls(self):
+        """Create the profile, font, theme, system info and export panels"""
+        from ..profiles import ProfileManager
+
+        self.profile_manager = ProfileManager()
+        # Pick up profiles edited by other programs off the GUI thread
+        self.profile_manager.start_watching()
+        self.theme_registry = ThemeRegistry()
+        controls_layout = self.controls_layout
+        
+        # Profiles
+        profiles_group = QGroupBox("Profiles")
+        profiles_layout = QVBoxLayout(profiles_group)
+        self.profile_filter = QLineEdit()
+        self.profile_filter.setPlaceholderText("Filter, e.g. arch gpu:rtx")
+        self.profile_filter.setClearButtonEnabled(True)
+        profiles_layout.addWidget(self.profile_filter)
+        self.profile_combo = QComboBox()
+        profiles_layout.addWidget(self.profile_combo)
+        profile_buttons = QHBoxLayout()
+        self.new_profile_btn = QPushButton("New")
+        self.save_profile_btn = QPushButton("Save")
+        self.delete_profile_btn = QPushButton("Delete")
+        for btn in (self.new_profile_btn, self.save_profile_btn, self.delete_profile_btn):
+            btn.setMinimumWidth(0)
+            profile_buttons.addWidget(btn)
+        profiles_layout.addLayout(profile_buttons)
+        controls_layout.insertWidget(0, profiles_group)
+        self.filter_profiles("")
+        
+        # Font settings
+        font_group = QGroupBox("Font Settings")
+        font_layout = QVBoxLayout(font_group)
+        
+        # Font family
+        font_layout.addWidget(QLabel("Font Family:"))
+        self.font_combo = QFontComboBox()
+        self.font_combo.setCurrentFont(QFont("Ubuntu Mono"))
+        font_layout.addWidget(self.font_combo)
+        
+        # Font size
+        font_layout.addWidget(QLabel("Font Size:"))
+        self.font_size = QSpinBox()
+        self.font_size.setRange(8, 24)
+        self.font_size.setValue(10)
+        font_layout.addWidget(self.font_size)
+        
+        controls_layout.insertWidget(controls_layout.count() - 1, font_group)
+        
+        # Theme Colors
+        colors_group = QGroupBox("Theme Colors")
+        colors_layout = QGridLayout(colors_group)
+        colors_layout.setSpacing(5)
+        
+        # Saved themes; edited files apply when picked again, Reload lists new ones
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(self.theme_registry.names())
+        self.theme_combo.setCurrentIndex(-1)
+        self.theme_combo.setPlaceholderText("Load theme...")
+        self.reload_themes_btn = QPushButton("Reload")
+        self.reload_themes_btn.setMinimumWidth(0)
+        colors_layout.addWidget(self.theme_combo, 0, 0)
+        colors_layout.addWidget(self.reload_themes_btn, 0, 1)
+        
+        color_elements = [
+            ("Background", "background"),
+            ("Text", "text"),
+            ("Logo", "logo"),
+            ("Labels", "label"),
+            ("Info", "info"),
+            ("User", "user"),
+            ("Separator", "separator")
+        ]
+        
+        for i, (label_text, color_key) in enumerate(color_elements):
+            label = QLabel(label_text + ":")
+            btn = QPushButton()
+            btn.setFixedSize(30, 20)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.clicked.connect(lambda checked, k=color_key: self.choose_color(k))
+            
+            # Store button for later access
+            self.color_buttons[color_key] = btn
+            
+            colors_layout.addWidget(label, i + 1, 0)
+            colors_layout.addWidget(btn, i + 1, 1)
+        
+        controls_layout.insertWidget(controls_layout.count() - 1, colors_group)
+        
+        # System Information
+        info_group = QGroupBox("System Information")
+        info_layout = QVBoxLayout(info_group)
+        
+        # Live mode re-samples uptime, memory and usage stats on a timer
+        self.live_checkbox = QCheckBox("Live Stats")
+        info_layout.addWidget(self.live_checkbox)
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(self.LIVE_INTERVAL_MS)
+        
+        # Create input fields for each system info item
+        self.info_inputs = {}
+        for key, value in self.system_info.to_dict().items():
+            label = QLabel(key.capitalize() + ":")
+            input_field = QLineEdit(value)
+            input_field.textChanged.connect(lambda text, k=key: self.update_info(k, text))
+            self.info_inputs[key] = input_field
+            info_layout.addWidget(label)
+            info_layout.addWidget(input_field)
+        
+        controls_layout.insertWidget(controls_layout.count() - 1, info_group)
+        
+        # Export controls
+        export_group = QGroupBox("Export")
+        export_layout = QVBoxLayout(export_group)
+        
+        self.copy_btn = QPushButton("Copy to Clipboard")
+        self.screenshot_btn = QPushButton("Take Screenshot")
+        export_layout.addWidget(self.copy_btn)
+        export_layout.addWidget(self.screenshot_btn)
+        
+        controls_layout.insertWidget(controls_layout.count() - 1, export_group)
+
     def update_display(self):
         """Update the terminal display with current settings"""
         try:
@@ -428,41 +469,47 @@ class MainWindow(QMainWindow):
             self.terminal.update_content(logo, self.system_info.to_dict())
             
             # Update color buttons to match current theme
-            for color_key, btn in self.color_buttons.items():
-                color = self.terminal.theme_colors[color_key]
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {color};
-                        border: 1px solid #666666;
-                        border-radius: 2px;
-                    }}
-                    QPushButton:hover {{
-                        border: 1px solid #999999;
-                    }}
-                """)
+            self.update_theme(self.terminal.theme_colors)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to update display: {str(e)}")
 
-    def update_font(self):
+    def schedule_render(self, *parts: str):
+        """Queue a render of the given parts, coalescing bursts of changes"""
+        self.render_scheduler.schedule(*parts)
+
+    def render_pending(self, parts: Set[str]):
+        """Render the parts queued by the render scheduler, laying out the document at most once"""
+        with tracing.span("window.render", "render", parts=sorted(parts)):
+            if "theme" in parts and self._pending_theme is not None:
+                theme, self._pending_theme = self._pending_theme, None
+                self.terminal.set_theme_colors(theme)
+            if "font" in parts:
+                self.update_font(render="content" not in parts)
+            if "content" in parts:
+                self.update_display()
+
+    def set_theme(self, theme: Dict[str, str]):
+        """Queue new theme colors to be applied on the next render"""
+        self._pending_theme = {**(self._pending_theme or {}), **theme}
+        self.schedule_render("theme", "content")
+
+    def update_font(self, render: bool = True):
         """Update the terminal font"""
         font_family = self.font_combo.currentFont().family()
         font_size = self.font_size.value()
-        self.terminal.set_font_family(font_family)
-        self.terminal.set_font_size(font_size)
+        self.terminal.set_font(font_family, font_size, render)
 
     def update_theme(self, theme: Dict[str, str]):
         """Update the theme colors"""
-        for color, button in self.color_buttons.items():
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {theme[color]};
-                    border: 1px solid #666;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    border: 1px solid #999;
-                }}
-            """)
+        for color_key, button in self.color_buttons.items():
+            self._style_color_button(color_key, theme[color_key])
+
+    def _style_color_button(self, color_key: str, color: str):
+        """Restyle a color button, skipping buttons that already show the color"""
+        if self._button_colors.get(color_key) == color:
+            return
+        self._button_colors[color_key] = color
+        self.color_buttons[color_key].setStyleSheet(color_button_style(color))
 
     def choose_color(self, color_key: str):
         """Open color picker and update theme color"""
@@ -472,33 +519,98 @@ class MainWindow(QMainWindow):
             
             if color.isValid():
                 # Update button style
-                self.color_buttons[color_key].setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {color.name()};
-                        border: 1px solid #666666;
-                        border-radius: 2px;
-                    }}
-                    QPushButton:hover {{
-                        border: 1px solid #999999;
-                    }}
-                """)
+                self._style_color_button(color_key, color.name())
                 
                 # Update terminal theme
-                self.terminal.theme_colors[color_key] = color.name()
-                self.terminal.apply_theme()
-                self.update_display()
+                self.set_theme({color_key: color.name()})
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to update color: {str(e)}")
 
+    def apply_named_theme(self, name: str):
+        """Apply a theme from the theme registry"""
+        theme = self.theme_registry.get(name)
+        if theme is None:
+            QMessageBox.warning(self, "Error", f"Theme not found: {name}")
+            self.reload_themes()
+            return
+        # Don't let extra logo colors of the previous theme leak into this one
+        for key in OPTIONAL_COLORS:
+            self.terminal.theme_colors.pop(key, None)
+        self.set_theme(theme.colors)
+
+    def reload_themes(self):
+        """Re-read the theme directories and refresh the theme list"""
+        self.theme_registry.refresh()
+        for path, error in self.theme_registry.errors.items():
+            QMessageBox.warning(self, "Invalid Theme", f"{path}: {error}")
+        self.theme_combo.blockSignals(True)
+        self.theme_combo.clear()
+        self.theme_combo.addItems(self.theme_registry.names())
+        self.theme_combo.setCurrentIndex(-1)
+        self.theme_combo.blockSignals(False)
+
     def update_info(self, key: str, value: str):
         """Update system info and refresh display"""
         setattr(self.system_info, key, value)
-        self.update_display()
+        self.schedule_render("content")
+
+    def set_live_mode(self, enabled: bool):
+        """Start or stop live re-sampling of volatile system info"""
+        if enabled:
+            self.update_live_stats()
+            self.live_timer.start()
+        else:
+            self.live_timer.stop()
+
+    def update_live_stats(self):
+        """Re-sample volatile fields and push only the changed ones to the terminal"""
+        try:
+            changed = self.system_info.sample_volatile()
+        except Exception as e:
+            self.live_checkbox.setChecked(False)
+            QMessageBox.warning(self, "Error", f"Failed to sample live stats: {str(e)}")
+            return
+        if not changed:
+            return
+
+        for key, value in changed.items():
+            input_field = self.info_inputs.get(key)
+            if input_field:
+                input_field.blockSignals(True)
+                input_field.setText(value)
+                input_field.blockSignals(False)
+        self.terminal.update_fields(changed)
+
+    def filter_profiles(self, query: str):
+        """List the profiles matching the filter box in the profile combo"""
+        try:
+            query = query.strip()
+            if query:
+                names = self.profile_manager.search_profiles(query, limit=self.PROFILE_LIST_LIMIT)
+            else:
+                names = self.profile_manager.get_profiles(limit=self.PROFILE_LIST_LIMIT)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to search profiles: {str(e)}")
+            return
+
+        current = self.profile_combo.currentText()
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.clear()
+        self.profile_combo.addItems(names)
+        if current in names:
+            self.profile_combo.setCurrentText(current)
+        self.profile_combo.blockSignals(False)
 
     def create_profile(self):
         """Create a new profile"""
         name, ok = QInputDialog.getText(self, "New Profile", "Enter profile name:")
         if ok and name:
+            from ..profiles import check_profile_name
+            try:
+                check_profile_name(name)
+            except ValueError as e:
+                QMessageBox.warning(self, "Error", str(e))
+                return
             self.profile_combo.addItem(name)
             self.profile_combo.setCurrentText(name)
             self.save_profile()
@@ -507,6 +619,8 @@ class MainWindow(QMainWindow):
         """Save current settings as a profile"""
         name = self.profile_combo.currentText()
         if name:
+            # Apply a queued theme or font first so the saved profile matches the screen
+            self.render_scheduler.flush()
             profile_data = {
                 "name": name,
                 "distro": self.distro_combo.currentText(),
@@ -515,7 +629,14 @@ class MainWindow(QMainWindow):
                 "theme": self.terminal.theme_colors,
                 "system_info": self.system_info.to_dict()
             }
-            self.profile_manager.save_profile(name, profile_data)
+            # Keep inheriting profiles as overlays on their parent
+            existing = self.profile_manager.load_profile(name)
+            if existing and existing.get("parent"):
+                profile_data["parent"] = existing["parent"]
+            try:
+                self.profile_manager.save_profile(name, profile_data)
+            except ValueError as e:
+                QMessageBox.warning(self, "Error", f"Failed to save profile: {str(e)}")
 
     def load_profile(self, name: str):
         """Load a saved profile"""
@@ -527,11 +648,11 @@ class MainWindow(QMainWindow):
             self.distro_combo.setCurrentText(profile["distro"])
             self.font_combo.setCurrentFont(QFont(profile["font_family"]))
             self.font_size.setValue(profile["font_size"])
-            self.terminal.set_theme_colors(profile["theme"])
+            self.set_theme(profile["theme"])
             for key, value in profile["system_info"].items():
                 if key in self.info_inputs:
-                    self.info_inputs[key].setText(value)
-            self.update_display()
+                    self.info_inputs[key].setText(str(value))
+            self.schedule_render("content")
 
     def delete_profile(self):
         """Delete the current profile"""
@@ -542,11 +663,19 @@ class MainWindow(QMainWindow):
 
     def setup_connections(self):
         """Set up connections for all widgets"""
-        self.distro_combo.currentTextChanged.connect(self.update_display)
-        self.font_combo.currentFontChanged.connect(self.update_font)
-        self.font_size.valueChanged.connect(self.update_font)
+        self.font_combo.currentFontChanged.connect(lambda: self.schedule_render("font"))
+        self.font_size.valueChanged.connect(lambda: self.schedule_render("font"))
         self.copy_btn.clicked.connect(self.copy_to_clipboard)
         self.screenshot_btn.clicked.connect(self.take_screenshot)
+        self.live_checkbox.toggled.connect(self.set_live_mode)
+        self.live_timer.timeout.connect(self.update_live_stats)
+        self.profile_filter.textChanged.connect(self.filter_profiles)
+        self.theme_combo.textActivated.connect(self.apply_named_theme)
+        self.reload_themes_btn.clicked.connect(self.reload_themes)
+        self.profile_combo.textActivated.connect(self.load_profile)
+        self.new_profile_btn.clicked.connect(self.create_profile)
+        self.save_profile_btn.clicked.connect(self.save_profile)
+        self.delete_profile_btn.clicked.connect(self.delete_profile)
 
     def copy_to_clipboard(self):
         """Copy the terminal content to the clipboard"""
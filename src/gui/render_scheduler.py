@@ -0,0 +1,40 @@
+from PyQt6.QtCore import QObject, QTimer
+from typing import Callable, Optional, Set
+
+
+class RenderScheduler(QObject):
+    """Coalesce bursts of change events into a single render"""
+
+    def __init__(self, render: Callable[[Set[str]], None], interval_ms: int = 16,
+                 debounce: bool = False, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.render = render
+        # With debounce, every new event pushes the render back by a full interval
+        self.debounce = debounce
+        self._pending: Set[str] = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def set_interval(self, interval_ms: int):
+        """Set how long to wait for more events before rendering"""
+        self._timer.setInterval(interval_ms)
+
+    def schedule(self, *parts: str):
+        """Mark parts of the view as dirty and render them on the next tick"""
+        self._pending.update(parts or ("content",))
+        if self.debounce or not self._timer.isActive():
+            self._timer.start()
+
+    def is_pending(self) -> bool:
+        """Check whether a render is waiting to run"""
+        return bool(self._pending)
+
+    def flush(self):
+        """Render all pending parts right away"""
+        self._timer.stop()
+        if not self._pending:
+            return
+        parts, self._pending = self._pending, set()
+        self.render(parts)
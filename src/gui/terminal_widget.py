@@ -1,10 +1,14 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QTextEdit, QMainWindow,
                               QPushButton, QDialog, QColorDialog, QHBoxLayout, QLabel, QFrame,
                               QGraphicsDropShadowEffect, QMessageBox, QFileDialog)
-from PyQt6.QtGui import QFont, QPalette, QColor, QTextCharFormat, QTextCursor, QIcon, QFontMetrics
+from PyQt6.QtGui import QFont, QColor, QTextCursor, QIcon, QFontMetrics
 from PyQt6.QtCore import Qt, pyqtSignal
 from typing import Optional, Dict
 
+from ..layout import SideBySideLayout
+from ..tracing import span, traced
+from .theme_cache import compile_theme
+
 class TerminalWindow(QMainWindow):
     def __init__(self, content: str, theme: Dict[str, str], font_family: str, font_size: int):
         super().__init__()
@@ -12,9 +16,7 @@ class TerminalWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         
         # Set window background color
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(theme["background"]))
-        self.setPalette(palette)
+        self.setPalette(compile_theme(theme).palette)
         
         # Create central widget with margins
         central_widget = QWidget()
@@ -112,8 +114,7 @@ class TerminalWindow(QMainWindow):
         # Create terminal widget
         self.terminal = TerminalWidget(is_preview=False)
         self.terminal.set_theme_colors(theme)
-        self.terminal.set_font_family(font_family)
-        self.terminal.set_font_size(font_size)
+        self.terminal.set_font(font_family, font_size, render=False)
         self.terminal.set_content(content)
         
         # Style the terminal widget
@@ -196,14 +197,20 @@ class TerminalWidget(QWidget):
     themeChanged = pyqtSignal(dict)
     fontChanged = pyqtSignal(str, int)
 
-    def __init__(self, is_preview: bool = False):
+    def __init__(self, is_preview: bool = False, interactive: bool = True):
         super().__init__()
         try:
             self.is_preview = is_preview
+            # Offscreen renderers have nobody to dismiss a dialog, so errors are raised instead
+            self.interactive = interactive
             self.current_font_family = "Ubuntu Mono"
             self.current_font_size = 10
             self.current_logo = ""
             self.current_info = {}
+            self._info_blocks = {}
+            self._layout_dirty = True
+            self.text_layout = SideBySideLayout()
+            self.compiled_theme = None
             self.theme_colors = {
                 "background": "#300A24",
                 "text": "#FFFFFF",
@@ -216,7 +223,8 @@ class TerminalWidget(QWidget):
             self.init_ui()
             self.setup_styles()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to initialize terminal widget: {str(e)}")
+            if interactive:
+                QMessageBox.critical(self, "Error", f"Failed to initialize terminal widget: {str(e)}")
             raise
 
     def init_ui(self):
@@ -226,16 +234,10 @@ class TerminalWidget(QWidget):
             layout.setSpacing(0)
             
             # Create terminal container
-            terminal_container = QFrame()
-            terminal_container.setFrameShape(QFrame.Shape.NoFrame)
-            terminal_container.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {self.theme_colors["background"]};
-                    border-radius: 4px;
-                }}
-            """)
+            self.terminal_container = QFrame()
+            self.terminal_container.setFrameShape(QFrame.Shape.NoFrame)
             
-            container_layout = QVBoxLayout(terminal_container)
+            container_layout = QVBoxLayout(self.terminal_container)
             container_layout.setContentsMargins(0, 0, 0, 0)
             container_layout.setSpacing(0)
             
@@ -284,7 +286,7 @@ class TerminalWidget(QWidget):
             """)
             
             container_layout.addWidget(self.terminal)
-            layout.addWidget(terminal_container)
+            layout.addWidget(self.terminal_container)
 
             if self.is_preview:
                 # Add "Open in Window" button for preview mode
@@ -292,20 +294,6 @@ class TerminalWidget(QWidget):
                 button_layout.setContentsMargins(0, 5, 0, 0)
                 
                 self.window_button = QPushButton("Open in Window")
-                self.window_button.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {self.theme_colors["background"]};
-                        color: {self.theme_colors["text"]};
-                        padding: 8px 16px;
-                        border: 1px solid {self.theme_colors["text"]};
-                        border-radius: 4px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {self.theme_colors["text"]};
-                        color: {self.theme_colors["background"]};
-                    }}
-                """)
                 self.window_button.clicked.connect(self.open_in_window)
                 
                 button_layout.addStretch()
@@ -317,38 +305,40 @@ class TerminalWidget(QWidget):
             self.update_font()
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to initialize terminal UI: {str(e)}")
+            if self.interactive:
+                QMessageBox.critical(self, "Error", f"Failed to initialize terminal UI: {str(e)}")
             raise
 
     def setup_styles(self):
-        """Setup text styles for different elements"""
-        self.styles = {
-            "user": self._create_format(self.theme_colors["user"]),
-            "separator": self._create_format(self.theme_colors["separator"]),
-            "label": self._create_format(self.theme_colors["label"]),
-            "info": self._create_format(self.theme_colors["info"]),
-            "logo": self._create_format(self.theme_colors["logo"]),
-        }
-
-    def _create_format(self, color: str) -> QTextCharFormat:
-        """Create a text format with specified color"""
-        format = QTextCharFormat()
-        format.setForeground(QColor(color))
-        return format
+        """Setup text styles for different elements from the compiled theme"""
+        compiled = compile_theme(self.theme_colors)
+        self.styles = compiled.formats
+        self.logo_formats = compiled.logo_formats
+        return compiled
 
+    @traced("terminal.apply_theme", "render")
     def apply_theme(self):
         """Apply the current theme colors"""
-        palette = self.terminal.palette()
-        palette.setColor(QPalette.ColorRole.Base, QColor(self.theme_colors["background"]))
-        palette.setColor(QPalette.ColorRole.Text, QColor(self.theme_colors["text"]))
-        self.terminal.setPalette(palette)
-        self.setup_styles()
+        compiled = self.setup_styles()
+        if compiled is self.compiled_theme:
+            return
+        self.compiled_theme = compiled
+        self.terminal.setPalette(compiled.palette)
+        self.terminal_container.setStyleSheet(compiled.container_style)
+        if self.is_preview:
+            self.window_button.setStyleSheet(compiled.window_button_style)
+        # Formats changed, so the next update has to re-lay out the document
+        self._layout_dirty = True
 
-    def update_font(self):
-        """Update the terminal font"""
+    @traced("terminal.update_font", "render")
+    def update_font(self, render: bool = True):
+        """Update the terminal font, re-rendering the content unless the caller will do it"""
         font = QFont(self.current_font_family, self.current_font_size)
         self.terminal.setFont(font)
-        self.update_content(self.current_logo, self.current_info)
+        if render:
+            self.update_content(self.current_logo, self.current_info)
+        else:
+            self._layout_dirty = True
 
     def set_theme_colors(self, colors: Dict[str, str]):
         """Set new theme colors"""
@@ -368,46 +358,97 @@ class TerminalWidget(QWidget):
         self.update_font()
         self.fontChanged.emit(self.current_font_family, self.current_font_size)
 
+    def set_font(self, family: str, size: int, render: bool = True):
+        """Set the terminal font family and size with a single update"""
+        self.current_font_family = family
+        self.current_font_size = size
+        self.update_font(render)
+        self.fontChanged.emit(self.current_font_family, self.current_font_size)
+
     def set_content(self, content: str):
         """Set raw content for the terminal"""
+        self._info_blocks = {}
         self.terminal.setPlainText(content)
 
     def update_content(self, logo: str, info: Dict[str, str]):
         """Update the terminal content with new logo and system info"""
         try:
+            # Same logo and fields as on screen: only patch the values that changed
+            if (not self._layout_dirty and self._info_blocks and logo == self.current_logo
+                    and list(info) == list(self.current_info)):
+                changed = {k: v for k, v in info.items() if self.current_info[k] != v}
+                if changed:
+                    self.update_fields(changed)
+                return
+
             self.current_logo = logo
-            self.current_info = info
+            self.current_info = dict(info)
+            self._layout_dirty = False
+            with span("terminal.layout", "render"):
+                self.text_layout.set_logo(logo)
+                self.text_layout.set_info(info)
+                rows = self.text_layout.rows()
             
             # Clear existing content
-            self.clear()
+            with span("terminal.clear", "render"):
+                self.clear()
             
             cursor = self.terminal.textCursor()
             
-            # Add logo with proper formatting
-            if logo:
-                cursor.insertText(logo + "\n", self.styles["logo"])
-            
-            # Add system info
-            if info:
-                # Calculate max label length for alignment
-                info_lines = [(f"{k}:", v) for k, v in info.items()]
-                if info_lines:
-                    max_label_length = max(len(label) for label, _ in info_lines if label)
-                    
-                    # Add info lines with proper alignment and colors
-                    for label, value in info_lines:
-                        if label:
-                            padding = " " * (max_label_length - len(label))
-                            cursor.insertText(f"{label}{padding} ", self.styles["label"])
-                            cursor.insertText(f"{value}\n", self.styles["info"])
+            # Add logo and system info side by side, one row per block
+            with span("terminal.insert", "render", rows=len(rows)):
+                for row in rows:
+                    for color, text in row.spans:
+                        cursor.insertText(text, self.logo_formats[color - 1])
+                    if row.key is not None:
+                        cursor.insertText(row.label, self.styles["label"])
+                        # Remember where each value lives so it can be patched in place; ask the
+                        # cursor because document positions count UTF-16 units, not code points
+                        self._info_blocks[row.key] = (cursor.blockNumber(), cursor.positionInBlock())
+                        cursor.insertText(row.value, self.styles["info"])
+                    cursor.insertText("\n", self.styles["info"])
             
             # Ensure content is visible
-            self.terminal.setTextCursor(cursor)
-            self.terminal.ensureCursorVisible()
+            with span("terminal.scroll", "render"):
+                self.terminal.setTextCursor(cursor)
+                self.terminal.ensureCursorVisible()
             
         except Exception as e:
+            if not self.interactive:
+                raise
+            QMessageBox.warning(self, "Warning", f"Failed to update terminal content: {str(e)}")
+
+    def update_fields(self, fields: Dict[str, str]):
+        """Replace the values of individual info lines without rebuilding the document"""
+        if any(key not in self._info_blocks for key in fields):
+            info = dict(self.current_info)
+            info.update(fields)
+            self.update_content(self.current_logo, info)
+            return
+
+        try:
+            with span("terminal.patch_fields", "render", fields=len(fields)):
+                self._patch_fields(fields)
+        except Exception as e:
+            if not self.interactive:
+                raise
             QMessageBox.warning(self, "Warning", f"Failed to update terminal content: {str(e)}")
 
+    def _patch_fields(self, fields: Dict[str, str]):
+        """Overwrite info values in place inside one edit block"""
+        document = self.terminal.document()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        for key, value in fields.items():
+            block_number, value_column = self._info_blocks[key]
+            block = document.findBlockByNumber(block_number)
+            cursor.setPosition(block.position() + value_column)
+            cursor.setPosition(block.position() + block.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(value, self.styles["info"])
+            self.current_info[key] = value
+            self.text_layout.set_value(key, value)
+        cursor.endEditBlock()
+
     def open_in_window(self):
         """Open the current terminal content in a new window"""
         content = self.terminal.toPlainText()
@@ -435,6 +476,7 @@ class TerminalWidget(QWidget):
 
     def clear(self):
         """Clear the terminal content"""
+        self._info_blocks = {}
         self.terminal.clear()
 
     def take_screenshot(self):
@@ -0,0 +1,90 @@
+"""
+Compile theme dicts into Qt colors, char formats and stylesheets once, memoized by theme
+"""
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from PyQt6.QtGui import QColor, QPalette, QTextCharFormat
+
+from ..ascii_art import logo_palette
+
+ThemeKey = Tuple[Tuple[str, str], ...]
+
+# Theme colors that get their own text format
+FORMAT_KEYS = ("user", "separator", "label", "info", "logo")
+
+
+def theme_key(theme: Dict[str, str]) -> ThemeKey:
+    """Get a hashable key identifying a theme's colors"""
+    return tuple(sorted(theme.items()))
+
+
+def _create_format(color: str) -> QTextCharFormat:
+    """Create a text format with specified color"""
+    format = QTextCharFormat()
+    format.setForeground(QColor(color))
+    return format
+
+
+class CompiledTheme:
+    """Qt objects and stylesheets built from one theme; shared, so treat them as read-only"""
+
+    def __init__(self, key: ThemeKey):
+        self.key = key
+        theme = dict(key)
+        self.colors: Dict[str, QColor] = {name: QColor(value) for name, value in theme.items()}
+        # Only the roles set here override the palette a widget inherits
+        self.palette = QPalette()
+        for role, name in ((QPalette.ColorRole.Window, "background"), (QPalette.ColorRole.Base, "background"),
+                           (QPalette.ColorRole.Text, "text"), (QPalette.ColorRole.WindowText, "text")):
+            self.palette.setColor(role, self.colors[name])
+        self.formats: Dict[str, QTextCharFormat] = {
+            name: _create_format(theme[name]) for name in FORMAT_KEYS if name in theme
+        }
+        # One format per ${c1}..${c6} logo color
+        self.logo_formats: List[QTextCharFormat] = [_create_format(color) for color in logo_palette(theme)]
+        self.container_style = f"""
+            QFrame {{
+                background-color: {theme["background"]};
+                border-radius: 4px;
+            }}
+        """
+        self.window_button_style = f"""
+            QPushButton {{
+                background-color: {theme["background"]};
+                color: {theme["text"]};
+                padding: 8px 16px;
+                border: 1px solid {theme["text"]};
+                border-radius: 4px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background-color: {theme["text"]};
+                color: {theme["background"]};
+            }}
+        """
+
+
+@lru_cache(maxsize=64)
+def _compile(key: ThemeKey) -> CompiledTheme:
+    return CompiledTheme(key)
+
+
+def compile_theme(theme: Dict[str, str]) -> CompiledTheme:
+    """Get the compiled form of a theme, building it only the first time it is seen"""
+    return _compile(theme_key(theme))
+
+
+@lru_cache(maxsize=256)
+def color_button_style(color: str) -> str:
+    """Get the stylesheet of a theme color picker button"""
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            border: 1px solid #666666;
+            border-radius: 2px;
+        }}
+        QPushButton:hover {{
+            border: 1px solid #999999;
+        }}
+    """
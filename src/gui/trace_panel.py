@@ -0,0 +1,71 @@
+from PyQt6.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
+                             QPushButton, QFileDialog, QMessageBox)
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFont
+
+from .. import tracing
+
+
+class TracePanel(QDockWidget):
+    """Debug dock showing where time goes, refreshed while it is visible"""
+
+    # How often to refresh the summary table
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__("Trace", parent)
+        self.setObjectName("trace_panel")
+
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(5, 5, 5, 5)
+
+        self.summary = QPlainTextEdit()
+        self.summary.setReadOnly(True)
+        self.summary.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.summary.setFont(QFont("Ubuntu Mono", 9))
+        layout.addWidget(self.summary)
+
+        buttons = QHBoxLayout()
+        self.clear_btn = QPushButton("Clear")
+        self.save_btn = QPushButton("Save Trace")
+        buttons.addWidget(self.clear_btn)
+        buttons.addWidget(self.save_btn)
+        layout.addLayout(buttons)
+        self.setWidget(container)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.timer.timeout.connect(self.refresh)
+        self.visibilityChanged.connect(self.set_refreshing)
+        self.clear_btn.clicked.connect(self.clear)
+        self.save_btn.clicked.connect(self.save_trace)
+
+    def set_refreshing(self, visible: bool):
+        """Only poll the tracer while the panel can be seen"""
+        if visible:
+            self.refresh()
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def refresh(self):
+        """Show the latest span summary"""
+        text = tracing.tracer.format_summary()
+        if text != self.summary.toPlainText():
+            self.summary.setPlainText(text)
+
+    def clear(self):
+        """Drop the spans recorded so far"""
+        tracing.tracer.clear()
+        self.refresh()
+
+    def save_trace(self):
+        """Save the recorded spans as a Chrome trace file"""
+        path, _ = QFileDialog.getSaveFileName(self, "Save Trace", "trace.json", "Trace files (*.json)")
+        if not path:
+            return
+        try:
+            tracing.tracer.dump(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Failed to save trace: {str(e)}")
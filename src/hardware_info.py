@@ -1,35 +1,138 @@
-import platform
-import psutil
-import subprocess
-from typing import Dict, Optional
+# psutil, platform and subprocess are imported inside the probes that need them,
+# so importing this module (e.g. for the GUI's first paint) stays cheap
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 import os
 
+from .package_info import PackageCounter
+from .probe_cache import ProbeCache, fingerprint
+from .probe_scheduler import ProbeScheduler
+from .sysfs_info import PciIds, gpu_name, list_display_devices, read_drm_resolutions
+from .tracing import traced
+
 class SystemInfo:
-    def __init__(self):
-        self.info = {}
-        self.refresh()
+    # Field name -> probe method, in display order
+    PROBES = {
+        'OS': '_get_os_info',
+        'Host': '_get_host_info',
+        'Kernel': '_get_kernel_info',
+        'Uptime': '_get_uptime',
+        'Packages': '_get_package_info',
+        'Shell': '_get_shell_info',
+        'Resolution': '_get_resolution',
+        'DE': '_get_de_info',
+        'WM': '_get_wm_info',
+        'WM Theme': '_get_wm_theme',
+        'Theme': '_get_theme_info',
+        'Icons': '_get_icon_theme',
+        'Terminal': '_get_terminal_info',
+        'CPU': '_get_cpu_info',
+        'GPU': '_get_gpu_info',
+        'Memory': '_get_memory_info'
+    }
+
+    # What probes return when they can't find a value, e.g. "Unknown" or "Unknown CPU"
+    FALLBACK = "Unknown"
+
+    # Timeout for individual subprocess calls made by probes
+    SUBPROCESS_TIMEOUT = 2.0
+
+    # Probes that shell out get a budget above SUBPROCESS_TIMEOUT, so a hung command
+    # is killed by its own timeout and the probe can still return its fallback
+    PROBE_TIMEOUTS = {
+        'Shell': SUBPROCESS_TIMEOUT + 1.0,
+        'Resolution': SUBPROCESS_TIMEOUT + 1.0,
+        'DE': SUBPROCESS_TIMEOUT + 1.0
+    }
+
+    # Inputs that a cached field depends on; fields not listed are always probed
+    CACHE_SOURCES = {
+        'OS': ('file:/etc/os-release',),
+        'Kernel': ('kernel',),
+        'Packages': ('file:/var/lib/dpkg/status', 'file:/var/lib/pacman/local',
+                     'file:/var/lib/rpm/rpmdb.sqlite', 'file:/snap', 'file:/var/lib/flatpak/app',
+                     'file:/var/lib/flatpak/runtime'),
+        'Shell': ('env:SHELL', 'boot_id'),
+        'DE': ('env:XDG_CURRENT_DESKTOP', 'boot_id'),
+        'CPU': ('boot_id',),
+        'GPU': ('boot_id',)
+    }
+
+    # Time-to-live in seconds for cached fields, on top of the fingerprint check
+    CACHE_TTLS = {
+        'Packages': 24 * 3600,
+        'Shell': 24 * 3600
+    }
+
+    def __init__(self, scheduler: Optional[ProbeScheduler] = None,
+                 cache: Optional[ProbeCache] = None, use_cache: bool = True,
+                 overrides: Optional[Dict[str, str]] = None):
+        # Fields are probed lazily on first read and memoized here
+        self.info: Dict[str, str] = {}
+        self.overridden: Set[str] = set()
+        self.timings: Dict[str, float] = {}
+        self.timed_out: Set[str] = set()
+        self.scheduler = scheduler or ProbeScheduler(timeouts=self.PROBE_TIMEOUTS)
+        self.package_counter = PackageCounter()
+        self.pci_ids = PciIds()
+        self.cache = (cache or ProbeCache(ttls=self.CACHE_TTLS)) if use_cache else None
+        for key, value in (overrides or {}).items():
+            self.set_fake_info(key, value)
 
     def refresh(self) -> None:
         """Refresh all system information"""
-        self.info = {
-            'OS': f"{self._get_os_info()}",
-            'Host': self._get_host_info(),
-            'Kernel': self._get_kernel_info(),
-            'Uptime': self._get_uptime(),
-            'Packages': self._get_package_info(),
-            'Shell': self._get_shell_info(),
-            'Resolution': self._get_resolution(),
-            'DE': self._get_de_info(),
-            'WM': self._get_wm_info(),
-            'WM Theme': self._get_wm_theme(),
-            'Theme': self._get_theme_info(),
-            'Icons': self._get_icon_theme(),
-            'Terminal': self._get_terminal_info(),
-            'CPU': self._get_cpu_info(),
-            'GPU': self._get_gpu_info(),
-            'Memory': self._get_memory_info()
-        }
+        self.info = {key: value for key, value in self.info.items() if key in self.overridden}
+        self._resolve(self.PROBES)
+
+    @traced("SystemInfo.resolve", "probe")
+    def _resolve(self, keys) -> None:
+        """Probe the given fields that are not yet resolved or overridden"""
+        missing = [key for key in keys if key in self.PROBES and key not in self.info]
+        if not missing:
+            return
+
+        results = {}
+        fingerprints = {}
+        if self.cache is not None:
+            for key in missing:
+                if key in self.CACHE_SOURCES:
+                    fingerprints[key] = fingerprint(self.CACHE_SOURCES[key])
+                    cached = self.cache.get(key, fingerprints[key])
+                    if cached is not None:
+                        results[key] = cached
+
+        probes = {key: getattr(self, self.PROBES[key]) for key in missing if key not in results}
+        probed = self.scheduler.run(probes, fallback=self.FALLBACK)
+        self.timings.update(self.scheduler.timings)
+        self.timed_out.difference_update(probes)
+        self.timed_out.update(self.scheduler.timed_out)
+        results.update(probed)
+
+        if self.cache is not None and probed:
+            for key, value in probed.items():
+                # A fallback usually means a probe failed; caching it would keep it until the
+                # fingerprint changes (for GPU, the next reboot), so probe again next time
+                if (key in fingerprints and key not in self.scheduler.timed_out
+                        and not value.startswith(self.FALLBACK)):
+                    self.cache.put(key, fingerprints[key], value)
+            self.cache.save()
+
+        self.info.update(results)
+
+    def get_probe_timings(self) -> Dict[str, float]:
+        """Get the wall-time in seconds of each probe that has run"""
+        return dict(self.timings)
+
+    def get_timed_out_probes(self) -> List[str]:
+        """Get the fields whose probes did not finish in time"""
+        return [key for key in self.PROBES if key in self.timed_out]
+
+    def _run(self, command: str) -> str:
+        """Run a shell command with the probe subprocess timeout"""
+        import subprocess
+
+        return subprocess.check_output(command, shell=True, timeout=self.SUBPROCESS_TIMEOUT,
+                                       stderr=subprocess.DEVNULL).decode()
 
     def _get_os_info(self) -> str:
         """Get OS information"""
@@ -40,22 +143,30 @@ class SystemInfo:
                         return line.split("=")[1].strip().strip('"')
         except:
             pass
+        import platform
+
         return f"{platform.system()} {platform.release()}"
 
     def _get_host_info(self) -> str:
         """Get host information"""
         try:
+            import platform
+
             return platform.node()
         except:
             return "Unknown"
 
     def _get_kernel_info(self) -> str:
         """Get kernel information"""
+        import platform
+
         return platform.release()
 
     def _get_uptime(self) -> str:
         """Get system uptime"""
         try:
+            import psutil
+
             uptime = psutil.boot_time()
             delta = datetime.now() - datetime.fromtimestamp(uptime)
             hours = delta.seconds // 3600
@@ -67,18 +178,19 @@ class SystemInfo:
     def _get_package_info(self) -> str:
         """Get package information"""
         try:
-            dpkg = subprocess.check_output("dpkg --list | grep '^ii' | wc -l", shell=True).decode().strip()
-            snap = subprocess.check_output("snap list | tail -n +2 | wc -l", shell=True).decode().strip()
-            return f"{dpkg} (dpkg), {snap} (snap)"
+            counts = self.package_counter.count_all()
+            if counts:
+                return ", ".join(f"{count} ({name})" for name, count in counts)
         except:
-            return "Unknown"
+            pass
+        return "Unknown"
 
     def _get_shell_info(self) -> str:
         """Get shell information"""
         try:
             shell = os.environ.get('SHELL', '')
             if '/bash' in shell:
-                version = subprocess.check_output("bash --version | head -n1", shell=True).decode()
+                version = self._run("bash --version | head -n1")
                 return f"bash {version.split()[3]}"
             return shell
         except:
@@ -87,7 +199,11 @@ class SystemInfo:
     def _get_resolution(self) -> str:
         """Get screen resolution"""
         try:
-            xrandr = subprocess.check_output("xrandr | grep '*'", shell=True).decode()
+            resolutions = read_drm_resolutions()
+            if resolutions:
+                return ", ".join(resolutions)
+            # Fall back to xrandr for drivers that don't expose DRM modes
+            xrandr = self._run("xrandr | grep '*'")
             return xrandr.split()[0]
         except:
             return "Unknown"
@@ -97,7 +213,7 @@ class SystemInfo:
         try:
             de = os.environ.get('XDG_CURRENT_DESKTOP', '')
             if de == 'ubuntu:GNOME':
-                version = subprocess.check_output("gnome-shell --version", shell=True).decode()
+                version = self._run("gnome-shell --version")
                 return f"GNOME {version.split()[-1]}"
             return de
         except:
@@ -144,33 +260,32 @@ class SystemInfo:
             with open("/proc/cpuinfo", "r") as f:
                 for line in f:
                     if line.startswith("model name"):
+                        import psutil
+
                         model = line.split(":")[1].strip()
                         cores = psutil.cpu_count()
                         return f"{model} ({cores}) @ {psutil.cpu_freq().current/1000:.1f}GHz"
         except:
             pass
+        import platform
+
         return platform.processor() or "Unknown CPU"
 
     def _get_gpu_info(self) -> str:
         """Get GPU information"""
         gpus = []
         try:
-            # Intel GPU
-            intel = subprocess.check_output("lspci | grep -i 'vga\\|3d' | grep Intel", shell=True).decode()
-            if intel:
-                gpus.append("Intel Haswell-ULT")
-            
-            # NVIDIA GPU
-            nvidia = subprocess.check_output("lspci | grep -i 'vga\\|3d' | grep NVIDIA", shell=True).decode()
-            if nvidia:
-                gpus.append("NVIDIA GeForce 610M/710M/810M/820M")
+            for vendor, device in list_display_devices():
+                gpus.append(gpu_name(vendor, device, self.pci_ids))
         except:
             pass
-        return "\nGPU: ".join(gpus) if gpus else "Unknown"
+        return ", ".join(gpus) if gpus else "Unknown"
 
     def _get_memory_info(self) -> str:
         """Get memory information"""
         try:
+            import psutil
+
             mem = psutil.virtual_memory()
             used = int(mem.used / (1024 * 1024))  # Convert to MiB
             total = int(mem.total / (1024 * 1024))  # Convert to MiB
@@ -180,12 +295,26 @@ class SystemInfo:
 
     def get_all(self) -> Dict[str, str]:
         """Return all system information"""
-        return self.info
+        self._resolve(self.PROBES)
+        all_info = {key: self.info[key] for key in self.PROBES}
+        all_info.update((key, self.info[key]) for key in self.overridden if key not in self.PROBES)
+        return all_info
 
     def get_info(self, key: str) -> str:
         """Get specific system information by key"""
+        if key not in self.info:
+            self._resolve([key])
         return self.info.get(key, "Unknown")
 
     def set_fake_info(self, key: str, value: str) -> None:
         """Set fake information for a specific key"""
-        self.info[key] = value 
\ No newline at end of file
+        self.info[key] = value
+        self.overridden.add(key)
+
+    def clear_fake_info(self, key: Optional[str] = None) -> None:
+        """Remove fake information for a key, or for every key when none is given"""
+        keys = list(self.overridden) if key is None else [key]
+        for k in keys:
+            if k in self.overridden:
+                self.overridden.discard(k)
+                self.info.pop(k, None) 
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Side-by-side logo/info layout shared by the Qt view and text exports
+"""
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .ascii_art import Span, logo_record
+from .utils.text import display_width
+
+
+class LayoutRow(NamedTuple):
+    logo: str
+    spans: Tuple[Span, ...]
+    key: Optional[str]
+    label: str
+    value: str
+
+
+@lru_cache(maxsize=64)
+def logo_column(logo: str, gap: int) -> Tuple[Tuple[str, ...], Tuple[Tuple[Span, ...], ...], int]:
+    """Pad every logo line to a common width; returns the lines, their color spans and the info column"""
+    if not logo:
+        return (), (), 0
+    record = logo_record(logo)
+    column = record.width + gap
+    lines = []
+    spans = []
+    for line, line_spans in zip(record.lines(), record.spans):
+        padding = " " * (column - display_width(line))
+        lines.append(line + padding)
+        # Padding joins the last run so it never costs an extra color switch
+        if line_spans:
+            spans.append(line_spans[:-1] + ((line_spans[-1][0], line_spans[-1][1] + padding),))
+        else:
+            spans.append(((1, padding),))
+    return tuple(lines), tuple(spans), column
+
+
+class SideBySideLayout:
+    """Merge logo rows and info rows into neofetch-style columns"""
+
+    def __init__(self, gap: int = 3):
+        self.gap = gap
+        self.logo = ""
+        self.logo_lines: Tuple[str, ...] = ()
+        self.logo_spans: Tuple[Tuple[Span, ...], ...] = ()
+        self.info_column = 0
+        self.info: Dict[str, str] = {}
+        self.keys: List[str] = []
+        self.label_width = 0
+
+    def set_logo(self, logo: str) -> bool:
+        """Use a new logo, returning whether the logo column changed"""
+        if logo == self.logo:
+            return False
+        self.logo = logo
+        self.logo_lines, self.logo_spans, self.info_column = logo_column(logo, self.gap)
+        return True
+
+    def set_info(self, info: Dict[str, str]) -> None:
+        """Use a new set of info fields"""
+        self.info = dict(info)
+        self.keys = list(info)
+        self.label_width = max((len(f"{key}:") for key in self.keys), default=0)
+
+    def set_value(self, key: str, value: str) -> int:
+        """Change a single value without touching the rest of the layout, returning its row"""
+        self.info[key] = value
+        return self.keys.index(key)
+
+    @property
+    def value_column(self) -> int:
+        """Get the column where info values start"""
+        return self.info_column + self.label_width + 1
+
+    def label_text(self, key: str) -> str:
+        """Get the padded label for a field, including the space before its value"""
+        label = f"{key}:"
+        return label + " " * (self.label_width - len(label)) + " "
+
+    def rows(self) -> List[LayoutRow]:
+        """Build every row of the merged layout"""
+        rows = []
+        blank = " " * self.info_column
+        blank_spans = ((1, blank),) if blank else ()
+        for i in range(max(len(self.logo_lines), len(self.keys))):
+            if i < len(self.keys):
+                key = self.keys[i]
+                if i < len(self.logo_lines):
+                    rows.append(LayoutRow(self.logo_lines[i], self.logo_spans[i], key,
+                                          self.label_text(key), self.info[key]))
+                else:
+                    rows.append(LayoutRow(blank, blank_spans, key, self.label_text(key), self.info[key]))
+            else:
+                # Logo rows below the info column keep their original width
+                record = logo_record(self.logo)
+                rows.append(LayoutRow(record.line(i), record.spans[i], None, "", ""))
+        return rows
@@ -0,0 +1,112 @@
+"""
+Packed single-file logo bundle, read through mmap
+
+Layout: an 8-byte magic, a little-endian uint32 entry count, then one
+table entry per logo (uint16 name length, UTF-8 name, uint32 offset,
+uint32 length) followed by the logo bodies. The manifest is stored as
+an entry named ``manifest.json`` so a single mapping holds everything.
+"""
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterator, Optional, Tuple
+
+from .utils.files import atomic_write
+
+MAGIC = b"FNLOGO1\0"
+MANIFEST_ENTRY = "manifest.json"
+
+_COUNT = struct.Struct("<I")
+_NAME_LENGTH = struct.Struct("<H")
+_SPAN = struct.Struct("<II")
+
+
+def default_bundle_path(logo_dir: str) -> str:
+    """Get the bundle path for a logo directory, kept beside it so writing it doesn't touch the directory"""
+    return os.path.normpath(logo_dir) + ".bundle"
+
+
+def build_bundle(entries: Dict[str, bytes], bundle_path: str) -> None:
+    """Pack named blobs into a bundle file"""
+    encoded = [(name.encode("utf-8"), data) for name, data in entries.items()]
+    table_size = sum(_NAME_LENGTH.size + len(name) + _SPAN.size for name, _ in encoded)
+    offset = len(MAGIC) + _COUNT.size + table_size
+
+    table = bytearray()
+    for name, data in encoded:
+        table += _NAME_LENGTH.pack(len(name)) + name + _SPAN.pack(offset, len(data))
+        offset += len(data)
+
+    with atomic_write(bundle_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_COUNT.pack(len(encoded)))
+        f.write(table)
+        for _, data in encoded:
+            f.write(data)
+
+
+class LogoBundle:
+    """Memory-mapped, read-only view of a logo bundle"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.entries: Dict[str, Tuple[int, int]] = self._read_table()
+
+    def _read_table(self) -> Dict[str, Tuple[int, int]]:
+        """Parse the offset table at the start of the bundle"""
+        if self._view[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a logo bundle: {self.path}")
+        pos = len(MAGIC)
+        (count,) = _COUNT.unpack_from(self._map, pos)
+        pos += _COUNT.size
+
+        entries = {}
+        for _ in range(count):
+            (name_length,) = _NAME_LENGTH.unpack_from(self._map, pos)
+            pos += _NAME_LENGTH.size
+            name = bytes(self._view[pos:pos + name_length]).decode("utf-8")
+            pos += name_length
+            entries[name] = _SPAN.unpack_from(self._map, pos)
+            pos += _SPAN.size
+        return entries
+
+    def get_bytes(self, name: str) -> Optional[memoryview]:
+        """Get a zero-copy view of an entry's bytes
+
+        The view keeps the mapping alive: close() then leaves the unmapping to the
+        garbage collector, so release the view (or copy it with bytes()) when done.
+        """
+        span = self.entries.get(name)
+        if span is None:
+            return None
+        offset, length = span
+        return self._view[offset:offset + length]
+
+    def get_text(self, name: str) -> Optional[str]:
+        """Get an entry decoded as UTF-8 text"""
+        data = self.get_bytes(name)
+        return None if data is None else str(data, "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def close(self) -> None:
+        """Release the memory mapping, or leave it to the garbage collector while views are still held"""
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            # A view from get_bytes() is still alive; the map is unmapped once it is dropped
+            pass
+
+
+if __name__ == "__main__":
+    from .logo_store import LogoStore
+
+    store = LogoStore(sys.argv[1] if len(sys.argv) > 1 else None)
+    path = store.build_bundle()
+    print(f"Packed {len(store.index)} logos into {path}")
@@ -0,0 +1,239 @@
+"""
+Indexed logo store: a manifest lists every logo up front, bodies are read on first use
+
+When a packed bundle (see logo_bundle.py) is at least as new as the logo
+directory and manifest, the manifest and bodies are read from it through one mmap.
+Editing a logo file in place changes neither mtime, so rebuild the index and bundle
+afterwards, or set FAKE_NEOFETCH_LOGO_DEV=1 to check every logo file on startup.
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional
+
+from .logo_bundle import MANIFEST_ENTRY, LogoBundle, build_bundle, default_bundle_path
+from .tracing import span, traced
+from .utils.files import atomic_write
+from .utils.text import display_width, strip_color_markers
+
+LOGO_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         "..", "resources", "ascii", "distro_logos"))
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Set to check each logo file's mtime on startup, for editing logos in place
+DEV_ENV_VAR = "FAKE_NEOFETCH_LOGO_DEV"
+
+# Suffixes dropped when matching names like "Arch Linux" or "elementary OS"
+NAME_SUFFIXES = ("gnulinux", "linux", "os")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distro name for lookups, e.g. "Pop!_OS" -> "popos" """
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def describe_logo(logo: str) -> Dict:
+    """Compute the manifest entry fields for a logo body"""
+    lines = strip_color_markers(logo).split("\n")
+    return {
+        "width": max(display_width(line) for line in lines),
+        "height": len(lines),
+        "sha256": hashlib.sha256(logo.encode("utf-8")).hexdigest()
+    }
+
+
+class LogoStore:
+    """Look up ASCII logos through a manifest index and load bodies lazily"""
+
+    def __init__(self, logo_dir: Optional[str] = None, bundle_path: Optional[str] = None,
+                 use_bundle: bool = True, check_files: Optional[bool] = None):
+        self.logo_dir = logo_dir or LOGO_DIR
+        # Off by default: statting every logo would make startup scale with the number of logos
+        self.check_files = bool(os.environ.get(DEV_ENV_VAR)) if check_files is None else check_files
+        self.manifest_path = os.path.join(self.logo_dir, MANIFEST_NAME)
+        self.bundle_path = bundle_path or default_bundle_path(self.logo_dir)
+        self.use_bundle = use_bundle
+        self.bundle: Optional[LogoBundle] = None
+        self.index: Dict[str, Dict] = {}
+        self._aliases: Dict[str, str] = {}
+        self._bodies: Dict[str, str] = {}
+        self.load_index()
+
+    @traced("logo_store.load_index", "disk")
+    def load_index(self) -> None:
+        """Load the manifest, building it from the logo files if it is missing"""
+        self._close_bundle()
+        if self.use_bundle and self._bundle_is_fresh():
+            try:
+                self.bundle = LogoBundle(self.bundle_path)
+                manifest = json.loads(self.bundle.get_text(MANIFEST_ENTRY) or "")
+                if manifest.get("version") == MANIFEST_VERSION:
+                    self.index = manifest["logos"]
+                    self._build_aliases()
+                    return
+            except (OSError, ValueError, KeyError):
+                pass
+            self._close_bundle()
+
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != MANIFEST_VERSION:
+                raise ValueError("unsupported manifest version")
+            self.index = manifest["logos"]
+            # A logo edited in place leaves the manifest's sizes and hashes stale
+            stale = self.check_files and os.stat(self.manifest_path).st_mtime_ns < self._newest_logo_mtime()
+        except (OSError, ValueError, KeyError):
+            stale = True
+        if stale:
+            self.rebuild_index()
+            self.save_index()
+        self._build_aliases()
+
+    @traced("logo_store.rebuild_index", "disk")
+    def rebuild_index(self) -> None:
+        """Scan the logo directory and describe every logo file"""
+        previous, self.index = self.index, {}
+        self._bodies = {}
+        if os.path.isdir(self.logo_dir):
+            for file_name in sorted(os.listdir(self.logo_dir)):
+                if file_name.endswith(".txt"):
+                    name = os.path.splitext(file_name)[0]
+                    self.index[name] = dict(file=file_name, **describe_logo(self._read(file_name)))
+                    # Hand-written aliases survive a rebuild
+                    if "aliases" in previous.get(name, {}):
+                        self.index[name]["aliases"] = previous[name]["aliases"]
+        self._build_aliases()
+
+    def save_index(self) -> None:
+        """Write the manifest next to the logo files"""
+        manifest = {"version": MANIFEST_VERSION, "logos": self.index}
+        try:
+            with atomic_write(self.manifest_path) as f:
+                json.dump(manifest, f, indent=4, sort_keys=True)
+                f.write("\n")
+        except OSError:
+            pass
+
+    def _bundle_is_fresh(self) -> bool:
+        """Check that the bundle is not older than the logo directory, manifest and, with check_files, any logo"""
+        try:
+            bundle_mtime = os.stat(self.bundle_path).st_mtime_ns
+            sources = [os.stat(self.logo_dir).st_mtime_ns]
+            if self.check_files:
+                sources.append(self._newest_logo_mtime())
+            if os.path.exists(self.manifest_path):
+                sources.append(os.stat(self.manifest_path).st_mtime_ns)
+        except OSError:
+            return False
+        return bundle_mtime >= max(sources)
+
+    def _newest_logo_mtime(self) -> int:
+        """Get the mtime of the most recently modified logo file, catching in-place edits"""
+        with os.scandir(self.logo_dir) as entries:
+            return max((entry.stat().st_mtime_ns for entry in entries if entry.name.endswith(".txt")), default=0)
+
+    def _close_bundle(self) -> None:
+        """Stop reading from the bundle"""
+        if self.bundle is not None:
+            self.bundle.close()
+            self.bundle = None
+
+    @traced("logo_store.build_bundle", "disk")
+    def build_bundle(self) -> str:
+        """Pack the manifest and every indexed logo into the bundle file"""
+        manifest = {"version": MANIFEST_VERSION, "logos": self.index}
+        entries = {MANIFEST_ENTRY: json.dumps(manifest, sort_keys=True).encode("utf-8")}
+        for name, entry in self.index.items():
+            entries[name] = self._read(entry["file"]).encode("utf-8")
+        build_bundle(entries, self.bundle_path)
+        return self.bundle_path
+
+    def _build_aliases(self) -> None:
+        """Map normalized names and declared aliases to logo names"""
+        self._aliases = {}
+        for name, entry in self.index.items():
+            for alias in [name] + entry.get("aliases", []):
+                self._aliases[normalize_name(alias)] = name
+
+    def _read(self, file_name: str) -> str:
+        """Read a logo file from disk"""
+        with span("logo_store.read", "disk", file=file_name):
+            with open(os.path.join(self.logo_dir, file_name), "r") as f:
+                return f.read()
+
+    def resolve(self, distro: str) -> Optional[str]:
+        """Resolve a distro name or alias to the name of a known logo"""
+        key = normalize_name(distro)
+        if key in self._aliases:
+            return self._aliases[key]
+        for suffix in NAME_SUFFIXES:
+            if key.endswith(suffix) and key[:-len(suffix)] in self._aliases:
+                return self._aliases[key[:-len(suffix)]]
+
+        # A logo file added without rebuilding the manifest
+        name = distro.lower()
+        file_name = f"{name}.txt"
+        if name and os.path.basename(name) == name and os.path.isfile(os.path.join(self.logo_dir, file_name)):
+            self.index[name] = dict(file=file_name, **describe_logo(self._read(file_name)))
+            self._aliases[key] = name
+            return name
+        return None
+
+    def get(self, distro: str) -> Optional[str]:
+        """Get a logo body, reading it from disk on first use"""
+        name = self.resolve(distro)
+        if name is None:
+            return None
+        if name not in self._bodies:
+            body = self.bundle.get_text(name) if self.bundle is not None else None
+            if body is None:
+                try:
+                    body = self._read(self.index[name]["file"])
+                except OSError:
+                    return None
+            self._bodies[name] = body
+        return self._bodies[name]
+
+    def get_entry(self, distro: str) -> Optional[Dict]:
+        """Get the manifest entry (file, width, height, sha256) for a logo"""
+        name = self.resolve(distro)
+        return self.index.get(name) if name else None
+
+    def names(self) -> List[str]:
+        """Get the names of all indexed logos"""
+        return list(self.index.keys())
+
+    def add(self, distro_name: str, logo: str) -> None:
+        """Save a logo file and add it to the manifest"""
+        name = distro_name.lower()
+        file_name = f"{name}.txt"
+        os.makedirs(self.logo_dir, exist_ok=True)
+        with open(os.path.join(self.logo_dir, file_name), "w") as f:
+            f.write(logo)
+
+        entry = dict(file=file_name, **describe_logo(logo))
+        if name in self.index and "aliases" in self.index[name]:
+            entry["aliases"] = self.index[name]["aliases"]
+        self.index[name] = entry
+        self._bodies[name] = logo
+        self._build_aliases()
+        self.save_index()
+        # Keep an existing bundle in step with the directory
+        if self.bundle is not None:
+            self._close_bundle()
+            try:
+                self.build_bundle()
+                self.bundle = LogoBundle(self.bundle_path)
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    store = LogoStore(sys.argv[1] if len(sys.argv) > 1 else None)
+    store.rebuild_index()
+    store.save_index()
+    print(f"Indexed {len(store.index)} logos in {store.manifest_path}")
@@ -1,19 +1,74 @@
+"""
+GUI entry point; pass --startup-report to print import and time-to-first-frame timings
+"""
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from gui.main_window import MainWindow
+import time
+from typing import List, Tuple
+
+# Taken before any heavy import so the report covers the whole startup
+STARTED = time.perf_counter()
+
+if __name__ == "__main__":
+    # Run as `python src/main.py` (see run.sh): make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StartupReport:
+    """Time the startup phases up to the first painted frame"""
+
+    def __init__(self):
+        self.phases: List[Tuple[str, float]] = []
+        self._last = STARTED
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the previous mark as a phase"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def format(self) -> str:
+        """Render the phases and the total time to first frame"""
+        lines = ["Startup timings:"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:32} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'time to first frame':32} {(self._last - STARTED) * 1000:8.1f} ms")
+        lines.append(f"  {'modules imported':32} {len(sys.modules):8d}")
+        return "\n".join(lines)
+
 
 def main():
-    app = QApplication(sys.argv)
-    
+    report = StartupReport() if "--startup-report" in sys.argv else None
+    argv = [arg for arg in sys.argv if arg != "--startup-report"]
+
+    from PyQt6.QtWidgets import QApplication
+    if report:
+        report.mark("import PyQt6")
+
+    from src.gui.main_window import MainWindow
+    if report:
+        report.mark("import main window")
+
+    app = QApplication(argv)
+
     # Set application style
     app.setStyle("Fusion")
-    
+    if report:
+        report.mark("create QApplication")
+
     # Create and show main window
     window = MainWindow()
+    if report:
+        report.mark("create main window")
+
+        def first_frame():
+            report.mark("show until first frame")
+            print(report.format(), file=sys.stderr)
+        window.firstFrameShown.connect(first_frame)
     window.show()
-    
+
     # Start event loop
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,155 @@
+import os
+import sqlite3
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def count_dpkg(path: str) -> int:
+    """Count installed packages in a dpkg status file"""
+    count = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"Status:") and line.rstrip().endswith(b" installed"):
+                count += 1
+    return count
+
+
+def count_pacman(path: str) -> int:
+    """Count installed packages in a pacman local database"""
+    count = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                count += 1
+    return count
+
+
+def count_rpm(path: str) -> int:
+    """Count installed packages in an sqlite rpmdb"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM Packages").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def count_snap(path: str) -> int:
+    """Count installed snaps from the snap mount directory"""
+    count = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir() and entry.name != "bin":
+                count += 1
+    return count
+
+
+def count_flatpak(path: str) -> int:
+    """Count installed flatpak apps and runtimes"""
+    count = 0
+    for kind in ("app", "runtime"):
+        try:
+            with os.scandir(os.path.join(path, kind)) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        count += 1
+        except OSError:
+            pass
+    return count
+
+
+def _mtime(path: str) -> Optional[int]:
+    """Get a path's mtime, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def read_distro_ids(path: str = "/etc/os-release") -> List[str]:
+    """Get the distro ID followed by its ID_LIKE parents from os-release"""
+    fields = {}
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                if "=" in line:
+                    key, value = line.rstrip("\n").split("=", 1)
+                    fields[key] = value.strip('"\'')
+    except OSError:
+        return []
+    return [fields.get("ID", "")] + fields.get("ID_LIKE", "").split()
+
+
+class PackageCounter:
+    """Count installed packages by reading package databases directly"""
+
+    # Backend name -> (database path, counter)
+    BACKENDS: Dict[str, Tuple[str, Callable[[str], int]]] = {
+        "dpkg": ("/var/lib/dpkg/status", count_dpkg),
+        "pacman": ("/var/lib/pacman/local", count_pacman),
+        "rpm": ("/var/lib/rpm/rpmdb.sqlite", count_rpm),
+        "snap": ("/snap", count_snap),
+        "flatpak": ("/var/lib/flatpak", count_flatpak)
+    }
+
+    # Native package manager for each distro family, checked before the others
+    DISTRO_BACKENDS = {
+        "debian": "dpkg",
+        "ubuntu": "dpkg",
+        "arch": "pacman",
+        "fedora": "rpm",
+        "rhel": "rpm",
+        "suse": "rpm"
+    }
+
+    # Paths whose mtimes change when packages are installed, where that isn't the database path itself;
+    # installing a flatpak adds a directory under app/ or runtime/ and leaves /var/lib/flatpak alone
+    WATCH_PATHS = {
+        "flatpak": ("/var/lib/flatpak/app", "/var/lib/flatpak/runtime")
+    }
+
+    NATIVE_BACKENDS = ["dpkg", "pacman", "rpm"]
+    UNIVERSAL_BACKENDS = ["snap", "flatpak"]
+
+    def __init__(self, backends: Optional[List[str]] = None):
+        self.backends = backends
+        self._counts: Dict[str, Tuple[Tuple[Optional[int], ...], int]] = {}
+
+    def select_backends(self) -> List[str]:
+        """Pick the backends to count, native package manager first"""
+        if self.backends is not None:
+            return list(self.backends)
+
+        natives = list(self.NATIVE_BACKENDS)
+        for distro_id in reversed(read_distro_ids()):
+            backend = self.DISTRO_BACKENDS.get(distro_id)
+            if backend:
+                natives.remove(backend)
+                natives.insert(0, backend)
+        return [name for name in natives + self.UNIVERSAL_BACKENDS
+                if os.path.exists(self.BACKENDS[name][0])]
+
+    def count(self, name: str) -> Optional[int]:
+        """Count packages for one backend, reusing the last count while its database is unchanged"""
+        path, counter = self.BACKENDS[name]
+        if not os.path.exists(path):
+            return None
+        mtimes = tuple(_mtime(watched) for watched in self.WATCH_PATHS.get(name, (path,)))
+
+        cached = self._counts.get(name)
+        if cached and cached[0] == mtimes:
+            return cached[1]
+
+        try:
+            count = counter(path)
+        except (OSError, sqlite3.Error):
+            return None
+        self._counts[name] = (mtimes, count)
+        return count
+
+    def count_all(self) -> List[Tuple[str, int]]:
+        """Count packages for every selected backend"""
+        counts = []
+        for name in self.select_backends():
+            count = self.count(name)
+            if count is not None:
+                counts.append((name, count))
+        return counts
@@ -0,0 +1,108 @@
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+from .tracing import traced
+from .utils.files import atomic_write
+
+
+def default_cache_path() -> str:
+    """Get the default location of the probe cache file"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "fake-neofetch", "probes.json")
+
+
+@traced("probe_cache.fingerprint", "disk")
+def fingerprint(sources: Iterable[str]) -> str:
+    """Build a cheap fingerprint from a list of probe input sources
+
+    Supported sources are ``file:<path>`` (mtime and size), ``env:<name>``,
+    ``kernel`` (the running kernel release) and ``boot_id``.
+    """
+    parts = []
+    for source in sources:
+        if source.startswith("file:"):
+            try:
+                stat = os.stat(source[5:])
+                parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                parts.append("-")
+        elif source.startswith("env:"):
+            parts.append(os.environ.get(source[4:], ""))
+        elif source == "kernel":
+            import platform
+
+            parts.append(platform.release())
+        elif source == "boot_id":
+            try:
+                with open("/proc/sys/kernel/random/boot_id", "r") as f:
+                    parts.append(f.read().strip())
+            except OSError:
+                parts.append("-")
+        else:
+            raise ValueError(f"Unknown fingerprint source: {source}")
+    return "|".join(parts)
+
+
+class ProbeCache:
+    """Persist probe results on disk, keyed by a fingerprint of each probe's inputs"""
+
+    def __init__(self, path: Optional[str] = None, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 7 * 24 * 3600):
+        self.path = path or default_cache_path()
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self.load()
+
+    @traced("probe_cache.load", "disk")
+    def load(self) -> None:
+        """Load cached entries from disk"""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries = data
+        except Exception:
+            self.entries = {}
+
+    def get_ttl(self, key: str) -> float:
+        """Get the time-to-live in seconds for a cached field"""
+        return self.ttls.get(key, self.default_ttl)
+
+    def get(self, key: str, fingerprint: str) -> Optional[str]:
+        """Get a cached value if its fingerprint matches and it has not expired"""
+        entry = self.entries.get(key)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        if time.time() - entry.get("time", 0) > self.get_ttl(key):
+            return None
+        return entry.get("value")
+
+    def put(self, key: str, fingerprint: str, value: str) -> None:
+        """Store a probe result under its fingerprint"""
+        self.entries[key] = {"fingerprint": fingerprint, "time": time.time(), "value": value}
+        self.dirty = True
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one cached field, or every field when no key is given"""
+        if key is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(key, None)
+        self.dirty = True
+
+    @traced("probe_cache.save", "disk")
+    def save(self) -> None:
+        """Write the cache to disk if it has changed"""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with atomic_write(self.path) as f:
+                json.dump(self.entries, f)
+            self.dirty = False
+        except OSError:
+            pass
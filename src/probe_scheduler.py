@@ -0,0 +1,85 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from .tracing import span
+
+
+class ProbeScheduler:
+    """Run independent system probes concurrently with per-probe timeouts"""
+
+    def __init__(self, max_workers: int = 16, default_timeout: float = 2.0,
+                 timeouts: Optional[Dict[str, float]] = None):
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.timeouts: Dict[str, float] = dict(timeouts or {})
+        self.timings: Dict[str, float] = {}
+        self.timed_out: Set[str] = set()
+
+    def get_timeout(self, key: str) -> float:
+        """Get the timeout in seconds for a probe"""
+        return self.timeouts.get(key, self.default_timeout)
+
+    def run(self, probes: Dict[str, Callable[[], str]], fallback: str = "Unknown") -> Dict[str, str]:
+        """Run all probes and return their results, using fallback for slow or failing ones"""
+        results: Dict[str, str] = {}
+        if not probes:
+            return results
+
+        self.timings = {}
+        self.timed_out = set()
+        started = time.perf_counter()
+        jobs: "queue.Queue[Tuple[str, Callable[[], str]]]" = queue.Queue()
+        finished: "queue.Queue[Tuple[str, Optional[str], float]]" = queue.Queue()
+        cancelled: Set[str] = set()
+        for key, probe in probes.items():
+            jobs.put((key, probe))
+        # Daemon threads rather than a ThreadPoolExecutor, whose workers are joined at
+        # interpreter exit: a hung probe must not keep a shell prompt waiting after we've given up
+        for i in range(min(self.max_workers, len(probes))):
+            threading.Thread(target=self._work, args=(jobs, finished, cancelled),
+                             name=f"probe-{i}", daemon=True).start()
+
+        deadlines = {key: started + self.get_timeout(key) for key in probes}
+        while deadlines:
+            now = time.perf_counter()
+            for key in [key for key, deadline in deadlines.items() if deadline <= now]:
+                del deadlines[key]
+                cancelled.add(key)
+                self.timed_out.add(key)
+                self.timings[key] = now - started
+                results[key] = fallback
+            if not deadlines:
+                break
+
+            try:
+                key, value, elapsed = finished.get(timeout=max(0.0, min(deadlines.values()) - now))
+            except queue.Empty:
+                continue
+            # Results of probes that already timed out are dropped with this run's queue
+            if deadlines.pop(key, None) is not None:
+                self.timings[key] = elapsed
+                results[key] = fallback if value is None else value
+
+        return results
+
+    def _work(self, jobs: queue.Queue, finished: queue.Queue, cancelled: Set[str]) -> None:
+        """Run queued probes until none are left, skipping ones that timed out while waiting"""
+        while True:
+            try:
+                key, probe = jobs.get_nowait()
+            except queue.Empty:
+                return
+            if key not in cancelled:
+                finished.put((key, *self._timed(key, probe)))
+
+    def _timed(self, key: str, probe: Callable[[], str]) -> Tuple[Optional[str], float]:
+        """Run a single probe, returning its result (None if it failed) and wall-time"""
+        start = time.perf_counter()
+        try:
+            with span(f"probe:{key}", "probe"):
+                value = probe()
+        except Exception:
+            value = None
+        return value, time.perf_counter() - start
@@ -0,0 +1,118 @@
+"""
+Streaming bulk import/export of profile collections as JSON Lines (optionally gzip-compressed)
+"""
+import gzip
+import json
+from typing import IO, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# How many records to validate before handing them to storage in one batch
+BATCH_SIZE = 500
+
+# How many records between progress callbacks
+PROGRESS_EVERY = 1000
+
+# Keep only the first few rejection messages so a bad archive can't exhaust memory
+MAX_ERRORS = 100
+
+ProgressCallback = Callable[[int], None]
+
+
+class ImportResult(NamedTuple):
+    imported: int
+    rejected: int
+    errors: List[Tuple[int, str]]
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open an archive as text, transparently handling .gz files"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def validate_profile_name(name) -> Optional[str]:
+    """Check that a profile name can be stored as a file, returning an error message or None"""
+    if not isinstance(name, str) or not name.strip():
+        return "missing profile name"
+    if "/" in name or "\\" in name or name in (".", ".."):
+        return f"invalid profile name: {name}"
+    return None
+
+
+def validate_profile(data) -> Optional[str]:
+    """Check a profile record, returning an error message or None when it is valid"""
+    if not isinstance(data, dict):
+        return "record is not an object"
+    error = validate_profile_name(data.get("name"))
+    if error:
+        return error
+    for key in ("distro", "font_family", "parent"):
+        if key in data and not isinstance(data[key], str):
+            return f"{key} must be a string"
+    if "font_size" in data and not isinstance(data["font_size"], int):
+        return "font_size must be an integer"
+    for key in ("theme", "system_info", "info"):
+        if key in data:
+            if not isinstance(data[key], dict):
+                return f"{key} must be an object"
+            if not all(isinstance(v, str) for v in data[key].values()):
+                return f"{key} values must be strings"
+    return None
+
+
+def export_archive(profiles: Iterable[Dict], path: str,
+                   progress: Optional[ProgressCallback] = None) -> int:
+    """Write profiles to a JSON Lines archive one record at a time, returning how many were written"""
+    count = 0
+    with _open(path, "w") as f:
+        for profile in profiles:
+            f.write(json.dumps(profile, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+            if progress and count % PROGRESS_EVERY == 0:
+                progress(count)
+    if progress:
+        progress(count)
+    return count
+
+
+def import_archive(path: str, write_batch: Callable[[List[Dict]], int],
+                   progress: Optional[ProgressCallback] = None, batch_size: int = BATCH_SIZE) -> ImportResult:
+    """Validate and import a JSON Lines archive in fixed-size batches"""
+    imported = 0
+    rejected = 0
+    errors: List[Tuple[int, str]] = []
+    batch: List[Dict] = []
+
+    def reject(line_number: int, message: str) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < MAX_ERRORS:
+            errors.append((line_number, message))
+
+    with _open(path, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                reject(line_number, f"invalid JSON: {e}")
+                continue
+            error = validate_profile(record)
+            if error:
+                reject(line_number, error)
+                continue
+
+            batch.append(record)
+            if len(batch) >= batch_size:
+                imported += write_batch(batch)
+                batch = []
+            if progress and line_number % PROGRESS_EVERY == 0:
+                progress(imported + len(batch))
+
+    if batch:
+        imported += write_batch(batch)
+    if progress:
+        progress(imported)
+    return ImportResult(imported, rejected, errors)
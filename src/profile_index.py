@@ -0,0 +1,144 @@
+"""
+Incrementally maintained inverted index over profile fields, with prefix and substring matching
+"""
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN = re.compile(r"[a-z0-9#]+")
+
+# (field, token) pairs; field is "" for the catch-all postings
+Term = Tuple[str, str]
+
+
+def tokenize(value: str) -> List[str]:
+    """Split a value into lowercase search tokens, e.g. "RTX 4090" -> ["rtx", "4090"]"""
+    return TOKEN.findall(str(value).lower())
+
+
+def trigrams(token: str) -> Set[str]:
+    """Get the distinct three-character fragments of a token, e.g. "#ffffff" -> {"#ff", "fff"}"""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def profile_terms(name: str, profile: Dict) -> Set[Term]:
+    """Collect the (field, token) terms a profile should be findable by"""
+    fields: List[Tuple[str, str]] = [("name", name)]
+    for key in ("distro", "font_family"):
+        if isinstance(profile.get(key), str):
+            fields.append((key, profile[key]))
+    for section in ("system_info", "info"):
+        for key, value in (profile.get(section) or {}).items():
+            fields.append((key.lower(), value))
+    for value in (profile.get("theme") or {}).values():
+        fields.append(("theme", value))
+
+    terms: Set[Term] = set()
+    for field, value in fields:
+        for token in tokenize(value):
+            terms.add((field, token))
+            terms.add(("", token))
+    return terms
+
+
+class ProfileIndex:
+    """Map search tokens to profile names, updated one profile at a time"""
+
+    def __init__(self):
+        self._postings: Dict[Term, Set[str]] = {}
+        self._doc_terms: Dict[str, Set[Term]] = {}
+        # Sorted token vocabulary per field for prefix lookups
+        self._vocab: Dict[str, List[str]] = {}
+        # Trigram -> tokens containing it, for substring lookups on the catch-all field
+        self._trigrams: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, name: str, profile: Dict) -> None:
+        """Index a profile, replacing any previous version of it"""
+        self.remove(name)
+        terms = profile_terms(name, profile)
+        self._doc_terms[name] = terms
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = set()
+                self._add_token(*term)
+            postings.add(name)
+
+    def add_many(self, profiles: Iterable[Tuple[str, Dict]]) -> None:
+        """Index several profiles"""
+        for name, profile in profiles:
+            self.add(name, profile)
+
+    def remove(self, name: str) -> None:
+        """Drop a profile from the index"""
+        for term in self._doc_terms.pop(name, ()):
+            postings = self._postings[term]
+            postings.discard(name)
+            if not postings:
+                del self._postings[term]
+                self._remove_token(*term)
+
+    def _add_token(self, field: str, token: str) -> None:
+        """Register a token the first time any profile uses it"""
+        insort(self._vocab.setdefault(field, []), token)
+        if field == "":
+            for trigram in trigrams(token):
+                self._trigrams.setdefault(trigram, set()).add(token)
+
+    def _remove_token(self, field: str, token: str) -> None:
+        """Forget a token once no profile uses it"""
+        vocab = self._vocab[field]
+        del vocab[bisect_left(vocab, token)]
+        if field == "":
+            for trigram in trigrams(token):
+                tokens = self._trigrams[trigram]
+                tokens.discard(token)
+                if not tokens:
+                    del self._trigrams[trigram]
+
+    def _prefix_tokens(self, field: str, prefix: str) -> List[str]:
+        """Find tokens in a field starting with a prefix"""
+        vocab = self._vocab.get(field, [])
+        start = bisect_left(vocab, prefix)
+        end = start
+        while end < len(vocab) and vocab[end].startswith(prefix):
+            end += 1
+        return vocab[start:end]
+
+    def _substring_tokens(self, field: str, fragment: str) -> List[str]:
+        """Find tokens in a field containing a fragment"""
+        if field == "" and len(fragment) >= 3:
+            candidates: Optional[Set[str]] = None
+            for i in range(len(fragment) - 2):
+                tokens = self._trigrams.get(fragment[i:i + 3], set())
+                candidates = tokens if candidates is None else candidates & tokens
+                if not candidates:
+                    return []
+            return [token for token in candidates if fragment in token]
+        return [token for token in self._vocab.get(field, []) if fragment in token]
+
+    def search(self, query: str, match: str = "substring") -> Set[str]:
+        """Find profiles matching every term of a query such as 'arch gpu:rtx'"""
+        if match not in ("prefix", "substring"):
+            raise ValueError(f"Unknown match mode: {match}")
+        result: Optional[Set[str]] = None
+        for part in query.split():
+            field, sep, value = part.partition(":")
+            if not sep:
+                field, value = "", part
+            for fragment in tokenize(value):
+                field_key = field.lower()
+                if match == "prefix":
+                    tokens = self._prefix_tokens(field_key, fragment)
+                else:
+                    tokens = self._substring_tokens(field_key, fragment)
+                names: Set[str] = set()
+                for token in tokens:
+                    names |= self._postings[(field_key, token)]
+                result = names if result is None else result & names
+                if not result:
+                    return set()
+        return result if result is not None else set(self._doc_terms)
@@ -0,0 +1,61 @@
+"""
+Copy-on-write profile inheritance: a profile names a parent and stores only the fields it changes
+"""
+from typing import Dict, Optional
+
+# Dict fields merged key by key with the parent's, rather than replaced wholesale
+MERGED_FIELDS = ("theme", "system_info", "info")
+
+# Fields that always belong to the profile itself and are never inherited
+OWN_FIELDS = ("name", "parent", "created_at", "last_modified")
+
+
+def merge_profile(base: Optional[Dict], overlay: Dict) -> Dict:
+    """Apply a profile's sparse overlay on top of its parent's resolved view"""
+    if not base:
+        return dict(overlay)
+    merged = dict(base)
+    for key, value in overlay.items():
+        if key in MERGED_FIELDS and isinstance(value, dict) and isinstance(base.get(key), dict):
+            merged[key] = {**base[key], **value}
+        else:
+            merged[key] = value
+    if "parent" not in overlay:
+        merged.pop("parent", None)
+    return merged
+
+
+def diff_profile(base: Dict, profile: Dict) -> Dict:
+    """Reduce a full profile to the overlay that reproduces it on top of base"""
+    overlay = {}
+    for key, value in profile.items():
+        if key in OWN_FIELDS:
+            overlay[key] = value
+        elif key in MERGED_FIELDS and isinstance(value, dict) and isinstance(base.get(key), dict):
+            changed = {k: v for k, v in value.items() if base[key].get(k) != v}
+            if changed:
+                overlay[key] = changed
+        elif base.get(key) != value:
+            overlay[key] = value
+    return overlay
+
+
+def inherited_distros(profiles: Dict[str, Dict]) -> Dict[str, str]:
+    """Get the distro each profile ends up with, taken from the nearest ancestor that sets one"""
+    distros: Dict[str, str] = {}
+    for name in profiles:
+        chain = []
+        current: Optional[str] = name
+        distro = ""
+        while current in profiles and current not in distros and current not in chain:
+            chain.append(current)
+            if "distro" in profiles[current]:
+                distro = str(profiles[current]["distro"])
+                break
+            current = profiles[current].get("parent")
+        else:
+            if current in distros:
+                distro = distros[current]
+        for member in chain:
+            distros[member] = distro
+    return distros
@@ -0,0 +1,305 @@
+"""
+Storage backends for ProfileManager: a directory of JSON files or a single SQLite database
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .profile_inheritance import inherited_distros
+from .utils.files import atomic_write
+
+
+class ProfileStorage(ABC):
+    """Where ProfileManager keeps its profiles"""
+
+    # Whether every profile should be read into memory up front
+    preload = False
+
+    @abstractmethod
+    def list_names(self, offset: int = 0, limit: Optional[int] = None, distro: Optional[str] = None,
+                   modified_since: Optional[float] = None) -> List[str]:
+        """List profile names in order, optionally filtered by distro or modification time"""
+
+    def count(self) -> int:
+        """Count stored profiles"""
+        return len(self.list_names())
+
+    @abstractmethod
+    def read(self, name: str) -> Optional[Dict]:
+        """Read a single profile"""
+
+    def iter_profiles(self) -> Iterator[Tuple[str, Dict]]:
+        """Yield every stored profile one at a time"""
+        for name in self.list_names():
+            profile = self.read(name)
+            if profile is not None:
+                yield name, profile
+
+    @abstractmethod
+    def write_many(self, profiles: Dict[str, Dict], distros: Optional[Dict[str, str]] = None) -> None:
+        """Write several profiles at once, listed under the given (e.g. inherited) distros"""
+
+    @abstractmethod
+    def set_distros(self, distros: Dict[str, str]) -> None:
+        """Change the distro stored profiles are listed under without rewriting them"""
+
+    def list_children(self, name: str) -> List[str]:
+        """List the stored profiles whose "parent" is the given profile"""
+        return [child for child, profile in self.iter_profiles() if profile.get("parent") == name]
+
+    @abstractmethod
+    def delete_many(self, names: Iterable[str]) -> None:
+        """Delete several profiles at once"""
+
+    def poll_changes(self) -> Optional[Set[str]]:
+        """Get the names changed by other programs since the last poll, or None if anything may have changed"""
+        return set()
+
+    def close(self) -> None:
+        """Release any open resources"""
+
+
+class JsonDirectoryStorage(ProfileStorage):
+    """One JSON file per profile in a directory, the original on-disk layout"""
+
+    preload = True
+
+    def __init__(self, profiles_dir: str):
+        self.profiles_dir = profiles_dir
+        os.makedirs(self.profiles_dir, exist_ok=True)
+        self._mtimes: Dict[str, int] = {}
+        # name -> (mtime, distro) for filtered listings without re-reading unchanged files
+        self._meta: Dict[str, Tuple[int, str]] = {}
+        self._scan()
+
+    def _path(self, name: str) -> str:
+        """Get the file path of a profile"""
+        return os.path.join(self.profiles_dir, f"{name}.json")
+
+    def _scan(self) -> Set[str]:
+        """Stat every profile file, returning the names that are new, changed or gone"""
+        try:
+            filenames = os.listdir(self.profiles_dir)
+        except OSError:
+            return set()
+
+        mtimes = {}
+        for filename in filenames:
+            if filename.endswith(".json"):
+                name = filename[:-5]
+                try:
+                    mtimes[name] = os.stat(self._path(name)).st_mtime_ns
+                except OSError:
+                    continue
+        changed = {name for name, mtime in mtimes.items() if self._mtimes.get(name) != mtime}
+        changed |= set(self._mtimes) - set(mtimes)
+        self._mtimes = mtimes
+        return changed
+
+    def list_names(self, offset: int = 0, limit: Optional[int] = None, distro: Optional[str] = None,
+                   modified_since: Optional[float] = None) -> List[str]:
+        names = sorted(self._mtimes)
+        if modified_since is not None:
+            threshold = int(modified_since * 1e9)
+            names = [name for name in names if self._mtimes[name] >= threshold]
+        if distro is not None:
+            names = [name for name in names if self._distro(name) == distro]
+        return names[offset:None if limit is None else offset + limit]
+
+    def count(self) -> int:
+        return len(self._mtimes)
+
+    def _distro(self, name: str) -> str:
+        """Get a profile's distro, re-reading the file only when it changed"""
+        mtime = self._mtimes.get(name)
+        meta = self._meta.get(name)
+        if meta is None or meta[0] != mtime:
+            profile = self.read(name) or {}
+            meta = (mtime, profile.get("distro", ""))
+            self._meta[name] = meta
+        return meta[1]
+
+    def read(self, name: str) -> Optional[Dict]:
+        try:
+            with open(self._path(name), "r") as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def write_many(self, profiles: Dict[str, Dict], distros: Optional[Dict[str, str]] = None) -> None:
+        for name, profile in profiles.items():
+            path = self._path(name)
+            with atomic_write(path) as f:
+                json.dump(profile, f, indent=4)
+            self._mtimes[name] = os.stat(path).st_mtime_ns
+            self._meta[name] = (self._mtimes[name], (distros or {}).get(name, profile.get("distro", "")))
+
+    def set_distros(self, distros: Dict[str, str]) -> None:
+        # Kept in memory only; ProfileManager sets them again after loading the directory
+        for name, distro in distros.items():
+            if name in self._mtimes:
+                self._meta[name] = (self._mtimes[name], distro)
+
+    def delete_many(self, names: Iterable[str]) -> None:
+        for name in names:
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+            self._mtimes.pop(name, None)
+            self._meta.pop(name, None)
+
+    def poll_changes(self) -> Optional[Set[str]]:
+        # Stat every file: rewriting an existing profile in place leaves the directory mtime alone
+        return self._scan()
+
+
+class SqliteProfileStorage(ProfileStorage):
+    """All profiles in one SQLite database, indexed by name, distro and modification time"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS profiles (
+            name TEXT PRIMARY KEY,
+            distro TEXT NOT NULL DEFAULT '',
+            modified REAL NOT NULL,
+            data TEXT NOT NULL,
+            parent TEXT
+        );
+        CREATE INDEX IF NOT EXISTS profiles_distro ON profiles (distro, name);
+        CREATE INDEX IF NOT EXISTS profiles_modified ON profiles (modified);
+    """
+
+    # Created after _migrate, since databases from before inheritance lack the column
+    PARENT_INDEX = "CREATE INDEX IF NOT EXISTS profiles_parent ON profiles (parent)"
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Background flushes run on another thread, so share the connection under a lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+            self._migrate()
+            self._conn.execute(self.PARENT_INDEX)
+        self._data_version = self._get_data_version()
+
+    def _migrate(self) -> None:
+        """Add the parent column to older databases, filling it and the inherited distros in"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(profiles)")}
+        if "parent" in columns:
+            return
+        self._conn.execute("ALTER TABLE profiles ADD COLUMN parent TEXT")
+        profiles = {}
+        for name, data in self._conn.execute("SELECT name, data FROM profiles"):
+            try:
+                profiles[name] = json.loads(data)
+            except ValueError:
+                continue
+        self._conn.executemany("UPDATE profiles SET parent = ?, distro = ? WHERE name = ?",
+                               [(profiles[name].get("parent"), distro, name)
+                                for name, distro in inherited_distros(profiles).items()])
+
+    def _get_data_version(self) -> int:
+        """Get SQLite's counter of commits made by other connections"""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def list_names(self, offset: int = 0, limit: Optional[int] = None, distro: Optional[str] = None,
+                   modified_since: Optional[float] = None) -> List[str]:
+        query = "SELECT name FROM profiles"
+        conditions = []
+        params: List = []
+        if distro is not None:
+            conditions.append("distro = ?")
+            params.append(distro)
+        if modified_since is not None:
+            conditions.append("modified >= ?")
+            params.append(modified_since)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY name LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def read(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM profiles WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def iter_profiles(self) -> Iterator[Tuple[str, Dict]]:
+        # Page through by name so memory stays flat however large the table is
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT name, data FROM profiles WHERE name > ? ORDER BY name LIMIT 500", (last,)
+                ).fetchall()
+            if not rows:
+                return
+            for name, data in rows:
+                try:
+                    yield name, json.loads(data)
+                except ValueError:
+                    continue
+            last = rows[-1][0]
+
+    def write_many(self, profiles: Dict[str, Dict], distros: Optional[Dict[str, str]] = None) -> None:
+        now = time.time()
+        distros = distros or {}
+        rows = [(name, str(distros.get(name, profile.get("distro", ""))), now, json.dumps(profile),
+                 profile.get("parent"))
+                for name, profile in profiles.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO profiles (name, distro, modified, data, parent) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def set_distros(self, distros: Dict[str, str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("UPDATE profiles SET distro = ? WHERE name = ?",
+                                   [(distro, name) for name, distro in distros.items()])
+
+    def list_children(self, name: str) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT name FROM profiles WHERE parent = ? ORDER BY name", (name,))]
+
+    def delete_many(self, names: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM profiles WHERE name = ?", [(name,) for name in names])
+
+    def poll_changes(self) -> Optional[Set[str]]:
+        data_version = self._get_data_version()
+        if data_version == self._data_version:
+            return set()
+        self._data_version = data_version
+        # Another process committed; we can't tell which rows, so drop everything cached
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_storage(location: str) -> ProfileStorage:
+    """Open the backend for a location: a .db/.sqlite file or a directory of JSON files"""
+    if location.endswith((".db", ".sqlite", ".sqlite3")):
+        return SqliteProfileStorage(location)
+    return JsonDirectoryStorage(location)
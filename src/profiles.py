@@ -1,55 +1,404 @@
 import os
 import json
-from typing import Dict, List, Optional
+import copy
+import atexit
+import logging
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 from datetime import datetime
 
+from .profile_archive import (ImportResult, ProgressCallback, export_archive, import_archive,
+                              validate_profile_name)
+from .profile_index import ProfileIndex
+from .profile_inheritance import diff_profile, inherited_distros, merge_profile
+from .profile_storage import ProfileStorage, open_storage
+from .tracing import span, traced
+
+logger = logging.getLogger(__name__)
+
+# Resolved against the package, not the working directory, so the CLI works from anywhere
+PROFILES_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             "..", "resources", "profiles"))
+
+
+def check_profile_name(name: str) -> None:
+    """Refuse names that can't be stored as a file, e.g. empty ones or ones containing a path separator"""
+    error = validate_profile_name(name)
+    if error:
+        raise ValueError(error)
+
+
 class ProfileManager:
-    def __init__(self):
-        self.profiles_dir = os.path.join("resources", "profiles")
-        os.makedirs(self.profiles_dir, exist_ok=True)
+    # Seconds to wait after a change before writing dirty profiles in the background
+    FLUSH_DELAY = 0.5
+
+    # Seconds to wait before retrying a background write that failed
+    RETRY_DELAY = 5.0
+
+    # Seconds between background checks of storage for external edits, see start_watching
+    CHECK_INTERVAL = 2.0
+
+    def __init__(self, profiles_dir: Optional[str] = None, flush_delay: Optional[float] = None,
+                 storage: Optional[ProfileStorage] = None):
+        self.profiles_dir = profiles_dir or PROFILES_DIR
+        self.storage = storage or open_storage(self.profiles_dir)
+        # Loaded profiles; together with pending changes this is authoritative over storage
         self.profiles: Dict[str, Dict] = {}
-        self.load_profiles()
+        self.flush_delay = self.FLUSH_DELAY if flush_delay is None else flush_delay
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        # The last write failure, cleared once a flush succeeds
+        self.flush_error: Optional[Exception] = None
+        # Merged views of inheriting profiles, and parent -> children links for invalidating them
+        self._resolved: Dict[str, Dict] = {}
+        self._children: Dict[str, Set[str]] = {}
+        # Search index, built on the first search and then kept up to date on every change
+        self._index: Optional[ProfileIndex] = None
+        if self.storage.preload:
+            self.load_profiles()
+        atexit.register(self._try_flush)
 
+    @traced("profiles.load_all", "disk")
     def load_profiles(self) -> None:
-        """Load all profiles from the profiles directory"""
-        for filename in os.listdir(self.profiles_dir):
-            if filename.endswith(".json"):
-                profile_name = os.path.splitext(filename)[0]
-                profile = self.load_profile(profile_name)
-                if profile:
-                    self.profiles[profile_name] = profile
-
-    def get_profiles(self) -> List[str]:
+        """Load all profiles from storage into memory"""
+        with self._lock:
+            for name, profile in self.storage.iter_profiles():
+                # Unsaved local changes win over the stored copy
+                if name not in self._dirty and name not in self._deleted:
+                    self.profiles[name] = profile
+            self._resolved.clear()
+            self._children.clear()
+            self._index = None
+            if self.storage.preload:
+                # List inheriting profiles under their inherited distro in find_profiles
+                distros = inherited_distros(self.profiles)
+                self.storage.set_distros({name: distros[name] for name, profile in self.profiles.items()
+                                          if profile.get("parent")})
+
+    def start_watching(self, interval: Optional[float] = None) -> None:
+        """Check storage for external edits every few seconds on a background thread"""
+        if self._watcher is not None:
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval or self.CHECK_INTERVAL,),
+                                         name="profile-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background change checks"""
+        self._stop_watching.set()
+        self._watcher = None
+
+    def _watch(self, interval: float) -> None:
+        """Poll for changes until stop_watching is called"""
+        while not self._stop_watching.wait(interval):
+            try:
+                self.check_for_changes()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Failed to check %s for changes: %s", self.profiles_dir, e)
+
+    def check_for_changes(self) -> None:
+        """Pick up profiles added, edited or removed by other programs"""
+        # Scan and read outside the lock so lookups on the GUI thread never wait on disk
+        with span("profiles.poll_changes", "disk"):
+            changed = self.storage.poll_changes()
+        reread: Dict[str, Optional[Dict]] = {}
+        if changed is not None and self.storage.preload:
+            reread = {name: self.storage.read(name) for name in changed}
+        with self._lock:
+            if changed is None:
+                changed = set(self.profiles)
+                self._resolved.clear()
+                self._children.clear()
+                self._index = None
+            changed -= self._dirty
+            for name in changed:
+                self.profiles.pop(name, None)
+                if self.storage.preload:
+                    profile = reread[name] if name in reread else self.storage.read(name)
+                    if profile is not None:
+                        self.profiles[name] = profile
+            self._profiles_changed(changed)
+            if self.storage.preload:
+                self.storage.set_distros(self._inherited_distros(changed))
+
+    def get_profiles(self, offset: int = 0, limit: Optional[int] = None) -> List[str]:
         """Get list of available profile names"""
-        profiles = []
-        for filename in os.listdir(self.profiles_dir):
-            if filename.endswith(".json"):
-                profiles.append(filename[:-5])  # Remove .json extension
-        return sorted(profiles)
+        with self._lock:
+            if not self._dirty and not self._deleted:
+                return self.storage.list_names(offset=offset, limit=limit)
+            names = (set(self.storage.list_names()) | self._dirty) - self._deleted
+        names = sorted(names)
+        return names[offset:None if limit is None else offset + limit]
+
+    def find_profiles(self, distro: Optional[str] = None, modified_since: Optional[float] = None,
+                      offset: int = 0, limit: Optional[int] = None) -> List[str]:
+        """Find stored profile names by distro and/or modification time, one page at a time"""
+        self.flush()
+        return self.storage.list_names(offset=offset, limit=limit, distro=distro,
+                                       modified_since=modified_since)
+
+    def count_profiles(self) -> int:
+        """Count available profiles"""
+        self.flush()
+        return self.storage.count()
+
+    def _get_index(self) -> ProfileIndex:
+        """Get the search index, building it from storage on first use"""
+        with self._lock:
+            if self._index is None:
+                with span("profiles.build_index", "profiles") as s:
+                    self._index = self._build_index()
+                    s.set(profiles=len(self._index))
+            return self._index
+
+    def _build_index(self) -> ProfileIndex:
+        """Index every profile, including unsaved ones"""
+        index = ProfileIndex()
+        # Preloaded profiles are all in memory already; only lazy backends need a pass over storage
+        profiles = list(self.profiles.items()) if self.storage.preload else self.storage.iter_profiles()
+        for name, profile in profiles:
+            if name not in self._dirty and name not in self._deleted:
+                index.add(name, self._resolved_profile(name) if profile.get("parent") else profile)
+        for name in self._dirty:
+            index.add(name, self._resolved_profile(name))
+        return index
+
+    def search_profiles(self, query: str, match: str = "substring",
+                        offset: int = 0, limit: Optional[int] = None) -> List[str]:
+        """Find profiles matching every term of a query such as "arch gpu:rtx" by substring or prefix"""
+        with self._lock, span("profiles.search", "profiles", query=query):
+            names = sorted(self._get_index().search(query, match))
+        return names[offset:None if limit is None else offset + limit]
+
+    def _profile(self, name: str) -> Optional[Dict]:
+        """Get the cached profile dict, reading it from storage on first use"""
+        with self._lock:
+            if name in self._deleted:
+                return None
+            profile = self.profiles.get(name)
+            if profile is None and not self.storage.preload:
+                with span("profiles.read", "disk", profile=name):
+                    profile = self.storage.read(name)
+                if profile is not None:
+                    self.profiles[name] = profile
+            return profile
+
+    def _resolved_profile(self, name: str) -> Optional[Dict]:
+        """Get a profile merged with its ancestors, memoized until one of them changes"""
+        with self._lock:
+            resolved = self._resolved.get(name)
+            if resolved is not None:
+                return resolved
+
+            # Walk up to the nearest memoized ancestor, stopping at missing parents and cycles
+            chain = []
+            seen: Set[str] = set()
+            base = None
+            current = name
+            while current and current not in seen:
+                if current in self._resolved:
+                    base = self._resolved[current]
+                    break
+                profile = self._profile(current)
+                if profile is None:
+                    break
+                seen.add(current)
+                chain.append((current, profile))
+                current = profile.get("parent")
+            if not chain:
+                return None
+
+            for current, profile in reversed(chain):
+                base = merge_profile(base, profile)
+                self._resolved[current] = base
+                parent = profile.get("parent")
+                if parent:
+                    self._children.setdefault(parent, set()).add(current)
+            return self._resolved[name]
+
+    def _profiles_changed(self, names: Iterable[str]) -> None:
+        """Drop memoized views of changed profiles and their descendants, reindexing them"""
+        stale: Set[str] = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in stale:
+                continue
+            stale.add(name)
+            self._resolved.pop(name, None)
+            stack.extend(self._children.pop(name, ()))
+
+        if self._index is not None:
+            for name in stale:
+                resolved = self._resolved_profile(name)
+                if resolved is None:
+                    self._index.remove(name)
+                else:
+                    self._index.add(name, resolved)
+
+    def _check_parent(self, name: str, parent: str) -> None:
+        """Refuse a parent that is the profile itself or one of its descendants"""
+        seen: Set[str] = set()
+        current: Optional[str] = parent
+        while current and current not in seen:
+            if current == name:
+                raise ValueError(f"Profile {name} cannot inherit from {parent}: that would form a cycle")
+            seen.add(current)
+            profile = self._profile(current)
+            current = profile.get("parent") if profile else None
+
+    def _child_names(self, name: str) -> List[str]:
+        """Find the profiles that inherit directly from a profile"""
+        if self.storage.preload:
+            return [child for child, profile in self.profiles.items() if profile.get("parent") == name]
+        children = {child for child in self.storage.list_children(name)
+                    if child not in self._dirty and child not in self._deleted}
+        children.update(child for child in self._dirty if self.profiles[child].get("parent") == name)
+        return sorted(children)
+
+    def _inherited_distros(self, names: Iterable[str]) -> Dict[str, str]:
+        """Resolve the distro of profiles and of every profile inheriting from them"""
+        if self.storage.preload:
+            # One pass over memory instead of one per profile
+            children: Dict[str, List[str]] = {}
+            for child, profile in self.profiles.items():
+                if profile.get("parent"):
+                    children.setdefault(profile["parent"], []).append(child)
+            child_names = lambda name: children.get(name, [])
+        else:
+            child_names = self._child_names
+
+        distros: Dict[str, str] = {}
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in distros:
+                continue
+            resolved = self._resolved_profile(name)
+            if resolved is None:
+                continue
+            distros[name] = str(resolved.get("distro", ""))
+            stack.extend(child_names(name))
+        return distros
 
     def load_profile(self, name: str) -> Optional[Dict]:
-        """Load a profile by name"""
-        filepath = os.path.join(self.profiles_dir, f"{name}.json")
-        if not os.path.exists(filepath):
-            return None
-            
-        try:
-            with open(filepath, "r") as f:
-                return json.load(f)
-        except Exception:
-            return None
+        """Load a profile by name, merged with the profiles it inherits from"""
+        profile = self._resolved_profile(name)
+        return copy.deepcopy(profile) if profile is not None else None
+
+    def _store(self, name: str, profile_data: Dict) -> None:
+        """Keep a profile in memory as dirty, reducing it to an overlay on its parent if it has one"""
+        parent = profile_data.get("parent")
+        if parent:
+            self._check_parent(name, parent)
+            profile_data = diff_profile(self._resolved_profile(parent) or {}, profile_data)
+        self.profiles[name] = copy.deepcopy(profile_data)
+        self._deleted.discard(name)
+        self._dirty.add(name)
+        self._profiles_changed([name])
 
     def save_profile(self, name: str, profile_data: Dict):
-        """Save a profile"""
-        filepath = os.path.join(self.profiles_dir, f"{name}.json")
-        with open(filepath, "w") as f:
-            json.dump(profile_data, f, indent=4)
+        """Save a profile; one with a "parent" only stores the fields that differ from it"""
+        check_profile_name(name)
+        with self._lock:
+            self._store(name, profile_data)
+        self._schedule_flush()
 
     def delete_profile(self, name: str):
-        """Delete a profile"""
-        filepath = os.path.join(self.profiles_dir, f"{name}.json")
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        """Delete a profile, folding its fields into any profiles that inherit from it"""
+        with self._lock:
+            profile = self._profile(name)
+            if profile is not None:
+                for child in self._child_names(name):
+                    resolved = dict(self._resolved_profile(child))
+                    resolved.pop("parent", None)
+                    if profile.get("parent"):
+                        resolved["parent"] = profile["parent"]
+                    self._store(child, resolved)
+            self.profiles.pop(name, None)
+            self._dirty.discard(name)
+            self._deleted.add(name)
+            self._profiles_changed([name])
+        self._schedule_flush()
+
+    @traced("profiles.bulk_import", "disk")
+    def bulk_import(self, profiles: Iterable[Dict]) -> int:
+        """Write many profiles straight to storage in one batch, returning how many were written"""
+        batch = {profile["name"]: profile for profile in profiles}
+        for name in batch:
+            check_profile_name(name)
+        self.flush()
+        with self._lock:
+            self.storage.write_many(batch)
+            for name, profile in batch.items():
+                if name in self.profiles or self.storage.preload:
+                    self.profiles[name] = profile
+            self._profiles_changed(batch)
+            # Rows were written under their own distro; fix up the ones that inherit a different one
+            self.storage.set_distros({name: distro for name, distro in self._inherited_distros(batch).items()
+                                      if name not in batch or distro != str(batch[name].get("distro", ""))})
+        return len(batch)
+
+    def bulk_export(self) -> Iterator[Dict]:
+        """Yield every profile one at a time, including unsaved changes"""
+        self.flush()
+        for _, profile in self.storage.iter_profiles():
+            yield profile
+
+    def _schedule_flush(self, delay: Optional[float] = None) -> None:
+        """Write pending changes after a short delay, batching bursts of edits"""
+        with self._lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self.flush_delay if delay is None else delay,
+                                                self._background_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write dirty profiles and remove deleted ones in storage"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                with span("profiles.flush", "disk", written=len(self._dirty), deleted=len(self._deleted)):
+                    if self._dirty:
+                        # A changed distro also moves every profile that inherits it
+                        distros = self._inherited_distros(self._dirty)
+                        self.storage.write_many({name: self.profiles[name] for name in self._dirty},
+                                                {name: distros[name] for name in self._dirty if name in distros})
+                        self.storage.set_distros({name: distro for name, distro in distros.items()
+                                                  if name not in self._dirty})
+                        self._dirty.clear()
+                    if self._deleted:
+                        self.storage.delete_many(self._deleted)
+                        self._deleted.clear()
+            except (OSError, sqlite3.Error) as e:
+                # Pending changes stay dirty so a later flush writes them
+                self.flush_error = e
+                raise
+            self.flush_error = None
+
+    def _try_flush(self) -> bool:
+        """Flush, logging a failure instead of raising it"""
+        try:
+            self.flush()
+            return True
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Failed to write profiles to %s: %s", self.profiles_dir, e)
+            return False
+
+    def _background_flush(self) -> None:
+        """Flush from the timer thread, retrying later if the write fails"""
+        if not self._try_flush():
+            self._schedule_flush(self.RETRY_DELAY)
 
     def get_profile(self, name: str) -> Optional[Dict]:
         """Get a profile by name (alias for load_profile)"""
@@ -57,42 +406,48 @@ class ProfileManager:
 
     def get_all_profiles(self) -> List[str]:
         """Get list of all profile names"""
-        return list(self.profiles.keys())
+        return self.get_profiles()
 
     def update_profile(self, name: str, info: Dict[str, str]) -> None:
         """Update an existing profile"""
-        if name in self.profiles:
-            self.profiles[name]["info"].update(info)
-            self.profiles[name]["last_modified"] = datetime.now().isoformat()
-            self.save_profile(name, self.profiles[name]["info"])
+        with self._lock:
+            profile = self._profile(name)
+            if profile is not None:
+                profile.setdefault("info", {}).update(info)
+                profile["last_modified"] = datetime.now().isoformat()
+                self._dirty.add(name)
+                self._profiles_changed([name])
+        self._schedule_flush()
 
     def get_profile_metadata(self, name: str) -> Optional[Dict]:
         """Get profile metadata including creation and modification dates"""
-        if name in self.profiles:
+        profile = self._profile(name)
+        if profile is not None:
             return {
-                "name": self.profiles[name]["name"],
-                "created_at": self.profiles[name]["created_at"],
-                "last_modified": self.profiles[name]["last_modified"]
+                "name": profile["name"],
+                "created_at": profile["created_at"],
+                "last_modified": profile["last_modified"]
             }
         return None
 
     def duplicate_profile(self, source_name: str, new_name: str) -> None:
-        """Create a duplicate of an existing profile with a new name"""
-        if source_name in self.profiles:
-            source_profile = self.profiles[source_name]
-            new_profile = {
+        """Create a profile inheriting everything from an existing one, to be changed copy-on-write"""
+        if self._profile(source_name) is not None:
+            self.save_profile(new_name, {
                 "name": new_name,
+                "parent": source_name,
                 "created_at": datetime.now().isoformat(),
-                "last_modified": datetime.now().isoformat(),
-                "info": source_profile["info"].copy()
-            }
-            self.save_profile(new_name, new_profile["info"])
+                "last_modified": datetime.now().isoformat()
+            })
 
     def export_profile(self, name: str, export_path: str) -> None:
-        """Export a profile to a specified path"""
-        if name in self.profiles:
+        """Export a profile to a specified path, with inherited fields merged in"""
+        profile = self._resolved_profile(name)
+        if profile is not None:
+            profile = dict(profile)
+            profile.pop("parent", None)
             with open(export_path, "w") as f:
-                json.dump(self.profiles[name], f, indent=4)
+                json.dump(profile, f, indent=4)
 
     def import_profile(self, filepath: str) -> bool:
         """Import a profile from a JSON file"""
@@ -104,4 +459,12 @@ class ProfileManager:
                 self.save_profile(profile_data["name"], profile_data)
                 return True
         except Exception:
-            return False 
\ No newline at end of file
+            return False
+
+    def export_profiles(self, archive_path: str, progress: Optional[ProgressCallback] = None) -> int:
+        """Export every profile to a JSON Lines archive (.jsonl, or .jsonl.gz for gzip)"""
+        return export_archive(self.bulk_export(), archive_path, progress)
+
+    def import_profiles(self, archive_path: str, progress: Optional[ProgressCallback] = None) -> ImportResult:
+        """Import a JSON Lines archive of profiles, skipping records that fail validation"""
+        return import_archive(archive_path, self.bulk_import, progress)
@@ -0,0 +1,154 @@
+import mmap
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+PCI_IDS_PATHS = [
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+    "/usr/share/pci.ids",
+    "/usr/local/share/pci.ids"
+]
+
+# Short vendor names used in the GPU line, like neofetch does
+GPU_VENDORS = {
+    "8086": "Intel",
+    "10de": "NVIDIA",
+    "1002": "AMD",
+    "1a03": "ASPEED",
+    "15ad": "VMware",
+    "1234": "QEMU",
+    "1af4": "Virtio"
+}
+
+VENDOR_LINE = re.compile(rb"\n[0-9a-f]{4}  |\nC ")
+
+
+def _read_sysfs(path: str) -> str:
+    """Read a single-value sysfs attribute"""
+    with open(path, "r") as f:
+        return f.read().strip()
+
+
+class PciIds:
+    """Look up PCI vendor and device names in a memory-mapped pci.ids database"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or next((p for p in PCI_IDS_PATHS if os.path.exists(p)), None)
+        self._map: Optional[mmap.mmap] = None
+        self._vendors: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._names: Dict[Tuple[str, str], Optional[str]] = {}
+
+    def _open(self) -> Optional[mmap.mmap]:
+        """Map the database into memory on first use"""
+        if self._map is None and self.path:
+            try:
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self.path = None
+        return self._map
+
+    def _vendor_span(self, vendor: str) -> Optional[Tuple[int, int]]:
+        """Find the byte range of a vendor's section, memoized per vendor"""
+        if vendor not in self._vendors:
+            data = self._open()
+            span = None
+            if data is not None:
+                start = data.find(b"\n" + vendor.encode() + b"  ")
+                if start >= 0:
+                    match = VENDOR_LINE.search(data, start + 1)
+                    span = (start + 1, match.start() if match else len(data))
+            self._vendors[vendor] = span
+        return self._vendors[vendor]
+
+    def _line_name(self, start: int, prefix_length: int) -> str:
+        """Read the name part of the database line starting at an offset"""
+        data = self._map
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = len(data)
+        return data[start + prefix_length:end].decode("utf-8", "replace").strip()
+
+    def vendor_name(self, vendor: str) -> Optional[str]:
+        """Get the name of a PCI vendor ID such as 8086"""
+        span = self._vendor_span(vendor.lower())
+        if span is None:
+            return None
+        return self._line_name(span[0], 4)
+
+    def device_name(self, vendor: str, device: str) -> Optional[str]:
+        """Get the name of a PCI device ID within a vendor"""
+        key = (vendor.lower(), device.lower())
+        if key not in self._names:
+            name = None
+            span = self._vendor_span(key[0])
+            if span is not None:
+                start = self._map.find(b"\n\t" + key[1].encode() + b"  ", span[0], span[1])
+                if start >= 0:
+                    name = self._line_name(start + 1, 5)
+            self._names[key] = name
+        return self._names[key]
+
+
+def list_display_devices(root: str = "/sys/bus/pci/devices") -> List[Tuple[str, str]]:
+    """List (vendor, device) IDs of PCI display controllers from sysfs"""
+    devices = []
+    try:
+        entries = sorted(os.listdir(root))
+    except OSError:
+        return devices
+    for entry in entries:
+        path = os.path.join(root, entry)
+        try:
+            # Class 0x03xxxx covers VGA, XGA, 3D and other display controllers
+            if not _read_sysfs(os.path.join(path, "class")).startswith("0x03"):
+                continue
+            vendor = _read_sysfs(os.path.join(path, "vendor"))[2:].lower()
+            device = _read_sysfs(os.path.join(path, "device"))[2:].lower()
+        except OSError:
+            continue
+        devices.append((vendor, device))
+    return devices
+
+
+def gpu_name(vendor: str, device: str, pci_ids: PciIds) -> str:
+    """Build a neofetch-style GPU name from PCI IDs"""
+    vendor_short = GPU_VENDORS.get(vendor)
+    if vendor_short is None:
+        vendor_full = pci_ids.vendor_name(vendor) or vendor
+        vendor_short = vendor_full.split()[0].rstrip(",")
+
+    name = pci_ids.device_name(vendor, device)
+    if name is None:
+        return f"{vendor_short} [{vendor}:{device}]"
+
+    # Prefer the marketing name in brackets, e.g. "GF117M [GeForce 610M/710M]"
+    match = re.search(r"\[(.+)\]", name)
+    if match:
+        name = match.group(1)
+    return f"{vendor_short} {name}"
+
+
+def read_drm_resolutions(root: str = "/sys/class/drm") -> List[str]:
+    """Get the preferred mode of every connected DRM connector"""
+    resolutions = []
+    try:
+        connectors = sorted(os.listdir(root))
+    except OSError:
+        return resolutions
+    for connector in connectors:
+        # Connectors are named like card0-HDMI-A-1; skip the card nodes themselves
+        if "-" not in connector:
+            continue
+        path = os.path.join(root, connector)
+        try:
+            if _read_sysfs(os.path.join(path, "status")) != "connected":
+                continue
+            with open(os.path.join(path, "modes"), "r") as f:
+                mode = f.readline().strip()
+        except OSError:
+            continue
+        if mode:
+            resolutions.append(mode)
+    return resolutions
@@ -0,0 +1,164 @@
+"""
+Theme registry loaded from JSON files: the bundled distro themes plus the user's own
+
+Each file holds {"name": ..., "colors": {...}}. Files are validated and compiled
+once and re-read only when their mtime changes, so edits apply without a restart.
+"""
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .ansi_renderer import compile_ansi
+from .logo_store import normalize_name
+from .utils.files import atomic_write
+
+THEME_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                          "..", "resources", "themes"))
+
+REQUIRED_COLORS = ("background", "text", "user", "separator", "label", "info", "logo")
+
+# Extra ${c2}..${c6} logo colors a theme may set
+OPTIONAL_COLORS = ("logo2", "logo3", "logo4", "logo5", "logo6")
+
+HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
+def user_theme_dir() -> str:
+    """Get the directory user themes are loaded from and saved to"""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(config_home, "fake-neofetch", "themes")
+
+
+def validate_theme(data) -> Optional[str]:
+    """Check a theme file's contents, returning an error message or None when it is valid"""
+    if not isinstance(data, dict):
+        return "theme is not an object"
+    if not isinstance(data.get("name"), str) or not data["name"].strip():
+        return "missing theme name"
+    colors = data.get("colors")
+    if not isinstance(colors, dict):
+        return "colors must be an object"
+    for key in REQUIRED_COLORS:
+        if key not in colors:
+            return f"missing color: {key}"
+    for key, value in colors.items():
+        if key not in REQUIRED_COLORS and key not in OPTIONAL_COLORS:
+            return f"unknown color: {key}"
+        if not isinstance(value, str) or not HEX_COLOR.fullmatch(value):
+            return f"{key} must be a #RRGGBB color"
+    return None
+
+
+class Theme:
+    """A validated theme with its ANSI escapes precompiled"""
+
+    __slots__ = ("name", "colors", "path", "mtime", "ansi")
+
+    def __init__(self, name: str, colors: Dict[str, str], path: str = "", mtime: int = 0):
+        self.name = name
+        self.colors = colors
+        self.path = path
+        self.mtime = mtime
+        self.ansi = compile_ansi(colors)
+
+
+class ThemeRegistry:
+    """Find themes by name across the bundled and user theme directories"""
+
+    def __init__(self, theme_dirs: Optional[List[str]] = None):
+        # Later directories win, so user themes can replace bundled ones
+        self.theme_dirs = theme_dirs or [THEME_DIR, user_theme_dir()]
+        self._themes: Dict[str, Theme] = {}
+        self._files: Dict[str, Tuple[int, Optional[Theme]]] = {}
+        self._dir_mtimes: Dict[str, Optional[int]] = {}
+        self.errors: Dict[str, str] = {}
+        self.refresh()
+
+    def _load(self, path: str, mtime: int) -> Optional[Theme]:
+        """Read and validate one theme file"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.errors[path] = str(e)
+            return None
+        error = validate_theme(data)
+        if error:
+            self.errors[path] = error
+            return None
+        self.errors.pop(path, None)
+        return Theme(data["name"], dict(data["colors"]), path, mtime)
+
+    def refresh(self) -> None:
+        """Pick up added, edited and removed theme files, re-reading only the changed ones"""
+        files: Dict[str, Tuple[int, Optional[Theme]]] = {}
+        for theme_dir in self.theme_dirs:
+            try:
+                self._dir_mtimes[theme_dir] = os.stat(theme_dir).st_mtime_ns
+                filenames = sorted(os.listdir(theme_dir))
+            except OSError:
+                self._dir_mtimes[theme_dir] = None
+                continue
+            for filename in filenames:
+                if not filename.endswith(".json"):
+                    continue
+                path = os.path.join(theme_dir, filename)
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                cached = self._files.get(path)
+                files[path] = cached if cached and cached[0] == mtime else (mtime, self._load(path, mtime))
+
+        for path in set(self.errors) - set(files):
+            del self.errors[path]
+        self._files = files
+        self._themes = {}
+        for _, theme in files.values():
+            if theme is not None:
+                self._themes[normalize_name(theme.name)] = theme
+
+    def _is_stale(self, theme: Optional[Theme]) -> bool:
+        """Check whether a theme file or any theme directory changed since the last refresh"""
+        for theme_dir, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(theme_dir).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                if mtime is not None:
+                    return True
+        if theme is None:
+            return False
+        try:
+            return os.stat(theme.path).st_mtime_ns != theme.mtime
+        except OSError:
+            return True
+
+    def get(self, name: str) -> Optional[Theme]:
+        """Get a theme by name, e.g. "Pop!_OS" or "pop_os", reloading it if its file changed"""
+        theme = self._themes.get(normalize_name(name))
+        if self._is_stale(theme):
+            self.refresh()
+            theme = self._themes.get(normalize_name(name))
+        return theme
+
+    def names(self) -> List[str]:
+        """List available theme names"""
+        if self._is_stale(None):
+            self.refresh()
+        return sorted((theme.name for theme in self._themes.values()), key=str.lower)
+
+    def save(self, name: str, colors: Dict[str, str]) -> Theme:
+        """Save a theme to the user theme directory"""
+        data = {"name": name, "colors": dict(colors)}
+        error = validate_theme(data)
+        if error:
+            raise ValueError(error)
+        theme_dir = self.theme_dirs[-1]
+        os.makedirs(theme_dir, exist_ok=True)
+        path = os.path.join(theme_dir, f"{normalize_name(name) or 'theme'}.json")
+        with atomic_write(path, encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        self.refresh()
+        return self._themes[normalize_name(name)]
@@ -0,0 +1,205 @@
+"""
+Lightweight span tracing, exported as Chrome trace / Perfetto JSON or a summary table
+
+Tracing is off by default and span() then returns a shared no-op context manager,
+so instrumented code pays one attribute check. Set FAKE_NEOFETCH_TRACE=1 to enable
+it, or FAKE_NEOFETCH_TRACE=trace.json to also write the trace to that file on exit.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+ENV_VAR = "FAKE_NEOFETCH_TRACE"
+
+# Stop recording after this many spans so a forgotten trace can't exhaust memory
+MAX_EVENTS = 1_000_000
+
+
+class SpanStats(NamedTuple):
+    name: str
+    category: str
+    count: int
+    total: float
+    mean: float
+    max: float
+
+
+class _NullSpan:
+    """Stand-in returned by span() while tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed region; use as a context manager"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.category, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+    def set(self, **args) -> None:
+        """Attach extra details to the span, e.g. how many items it handled"""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collect spans from every thread"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events: List[Dict] = []
+        self.dropped = 0
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._threads: Dict[int, str] = {}
+
+    def span(self, name: str, category: str = "app", **args):
+        """Start a span, or get the no-op span when tracing is disabled"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args)
+
+    def record(self, name: str, category: str, start: int, end: int, args: Optional[Dict] = None) -> None:
+        """Store a finished span given its perf_counter_ns start and end"""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            if len(self.events) >= MAX_EVENTS:
+                self.dropped += 1
+                return
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def clear(self) -> None:
+        """Forget every recorded span"""
+        with self._lock:
+            self.events = []
+            self.dropped = 0
+
+    def chrome_trace(self) -> Dict:
+        """Build a Chrome trace / Perfetto compatible document"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                    for tid, name in threads.items()]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str) -> None:
+        """Write the trace to a JSON file that chrome://tracing or ui.perfetto.dev can open"""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self) -> List[SpanStats]:
+        """Aggregate spans by name, slowest total first"""
+        totals: Dict[tuple, List[float]] = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            totals.setdefault((event["name"], event["cat"]), []).append(event["dur"] / 1e6)
+        stats = [SpanStats(name, category, len(durations), sum(durations),
+                           sum(durations) / len(durations), max(durations))
+                 for (name, category), durations in totals.items()]
+        return sorted(stats, key=lambda s: s.total, reverse=True)
+
+    def format_summary(self) -> str:
+        """Render the summary as a plain-text table"""
+        lines = [f"{'span':40} {'category':10} {'count':>7} {'total ms':>10} {'mean ms':>10} {'max ms':>10}"]
+        for s in self.summary():
+            lines.append(f"{s.name[:40]:40} {s.category[:10]:10} {s.count:>7} {s.total * 1000:>10.2f} "
+                         f"{s.mean * 1000:>10.3f} {s.max * 1000:>10.3f}")
+        if self.dropped:
+            lines.append(f"({self.dropped} spans dropped after the first {MAX_EVENTS})")
+        return "\n".join(lines)
+
+
+tracer = Tracer()
+
+
+def span(name: str, category: str = "app", **args):
+    """Time a block of code: `with span("logo_store.read", "disk", file=name):`"""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "app") -> Callable:
+    """Decorator recording a span around every call of a function"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable() -> None:
+    """Start recording spans"""
+    tracer.enabled = True
+
+
+def disable() -> None:
+    """Stop recording spans, keeping the ones already recorded"""
+    tracer.enabled = False
+
+
+def is_enabled() -> bool:
+    """Check whether spans are being recorded"""
+    return tracer.enabled
+
+
+def _enable_from_environment() -> None:
+    """Turn tracing on when FAKE_NEOFETCH_TRACE is set, dumping to it on exit if it names a file"""
+    value = os.environ.get(ENV_VAR, "")
+    if not value or value.lower() in ("0", "false", "no"):
+        return
+    enable()
+    if value.lower() not in ("1", "true", "yes"):
+        atexit.register(tracer.dump, value)
+
+
+_enable_from_environment()
@@ -0,0 +1,27 @@
+import re
+import unicodedata
+
+
+def char_width(char: str) -> int:
+    """Get the number of terminal cells a character occupies"""
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def display_width(text: str) -> int:
+    """Get the number of terminal cells a single line of text occupies"""
+    if text.isascii():
+        return len(text)
+    return sum(char_width(char) for char in text)
+
+
+# neofetch-style logo color markers, ${c1} through ${c6}
+COLOR_MARKER = re.compile(r"\$\{c([1-6])\}")
+
+
+def strip_color_markers(text: str) -> str:
+    """Remove ${cN} color markers from logo text"""
+    return COLOR_MARKER.sub("", text)
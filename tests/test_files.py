@@ -0,0 +1,23 @@
+import pytest
+
+from src.utils.files import atomic_write
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("old")
+    with atomic_write(str(path)) as f:
+        f.write("new")
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_atomic_write_cleans_up_on_failure(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("old")
+    with pytest.raises(ValueError):
+        with atomic_write(str(path)) as f:
+            f.write("half")
+            raise ValueError
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
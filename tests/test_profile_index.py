@@ -0,0 +1,62 @@
+from src.profile_index import ProfileIndex
+
+ARCH = {
+    "distro": "Arch Linux",
+    "theme": {"background": "#000000", "text": "#FFFFFF"},
+    "system_info": {"GPU": "NVIDIA RTX 4090", "CPU": "AMD Ryzen 9"}
+}
+UBUNTU = {
+    "distro": "Ubuntu",
+    "theme": {"background": "#300A24", "text": "#FFFFFF"},
+    "system_info": {"GPU": "Intel UHD 620"}
+}
+
+
+def build_index():
+    index = ProfileIndex()
+    index.add_many([("arch", ARCH), ("ubuntu", UBUNTU)])
+    return index
+
+
+def test_search_substring_and_prefix():
+    index = build_index()
+    assert index.search("rtx") == {"arch"}
+    assert index.search("yzen") == {"arch"}
+    assert index.search("yzen", match="prefix") == set()
+    assert index.search("ubu", match="prefix") == {"ubuntu"}
+    assert index.search("#ffffff") == {"arch", "ubuntu"}
+
+
+def test_search_fields_are_anded():
+    index = build_index()
+    assert index.search("gpu:intel") == {"ubuntu"}
+    assert index.search("gpu:intel arch") == set()
+    assert index.search("distro:arch gpu:4090") == {"arch"}
+
+
+def test_remove_token_with_repeated_trigram():
+    index = ProfileIndex()
+    index.add("a", {"theme": {"text": "#FFFFFF"}})
+    index.remove("a")
+    assert len(index) == 0
+    assert index.search("fff") == set()
+
+
+def test_add_remove_round_trip():
+    index = build_index()
+    index.remove("arch")
+    assert index.search("rtx") == set()
+    assert index.search("#ffffff") == {"ubuntu"}
+    index.add("arch", ARCH)
+    assert index.search("rtx") == {"arch"}
+    index.remove("arch")
+    index.remove("ubuntu")
+    assert len(index) == 0
+    assert index.search("#fff") == set()
+
+
+def test_re_adding_replaces_old_terms():
+    index = build_index()
+    index.add("arch", dict(ARCH, system_info={"GPU": "Radeon 7900"}))
+    assert index.search("rtx") == set()
+    assert index.search("radeon") == {"arch"}